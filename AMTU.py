@@ -9,7 +9,7 @@
 }
 
 # Imports standards
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Any
 import re
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
@@ -17,6 +17,18 @@ from tkinterdnd2 import *  # Pour le drag & drop
 from tkinterdnd2 import TkinterDnD, DND_FILES
 from genre_manager import GenreManager
 from models import TrackMetadata
+from tag_snapshot import TagSnapshot, probe_mp3
+from concurrency import SingleFlight, StageThread, ordered_map, queue_iter, queue_put
+from scan_cache import ScanCache
+from lookup_cache import ArtistCache, LookupCache, LRUCache, NotFoundCache
+from rate_limiter import RateLimiter
+from provider_stats import ProviderStats
+from circuit_breaker import OPEN, CircuitBreaker, CircuitOpenError
+from normalization import split_artists
+from logging_setup import apply_log_levels, configure_logging, subsystem_logger
+from fuzzy_index import FuzzyIndex
+from scoring import merge_ranked, rank_candidates
+from retry_policy import ProviderLookupError, RetryPolicy, TransientLookupError, http_status, is_retryable, retry_after
 from locales.locale_manager import LocaleManager
 import json
 from pathlib import Path
@@ -27,7 +39,10 @@ import time
 import csv
 import threading
 from queue import Queue, Empty
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import os
+import fnmatch
+import random
 
 # Imports tiers
 import spotipy
@@ -35,23 +50,99 @@ from spotipy.oauth2 import SpotifyClientCredentials
 import discogs_client
 import musicbrainzngs
 import mutagen
-from mutagen.easyid3 import EasyID3
-from mutagen.id3 import ID3, TCON, TXXX, TGID, TDRC, TPE2, TPE1, TALB, TIT2, TMCL
+from mutagen.id3 import TCON, TXXX, TGID, TDRC, TPE2, TPE1, TALB, TIT2, TMCL
 
 # Configuration du logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Les écritures des logs sont faites par un thread dédié (QueueHandler/QueueListener)
+configure_logging(logging.INFO)
 logger = logging.getLogger(__name__)
+# Sous-systèmes à fort volume, réglables séparément (réglage 'log_levels')
+match_logger = subsystem_logger(__name__, 'match')
+provider_logger = subsystem_logger(__name__, 'providers')
+writer_logger = subsystem_logger(__name__, 'writer')
 
 class ConfigManager:
     """Gère la configuration et la validation des APIs."""
     CONFIG_FILE = "set_api_config.json"
 
+    # Réglages de performance par défaut (surchargeables dans la section 'performance')
+    DEFAULT_PERFORMANCE = {
+        'scan_workers': 8,           # Threads de lecture des tags lors du scan
+        'scan_cache': True,          # Cache persistant des tags lus (chemin, taille, mtime)
+        'scan_cache_file': 'scan_cache.db',
+        'pipeline_queue_size': 16,   # Albums en attente entre deux étages du pipeline
+        'lookahead_albums': 4,       # Albums suivants recherchés pendant l'écriture du courant
+        'lookup_cache': True,        # Cache persistant des résultats de recherche
+        'lookup_cache_file': 'lookup_cache.db',
+        'lookup_cache_size': 50000,  # Nombre maximal d'entrées (éviction LRU)
+        'lookup_cache_ttl_days': {'musicbrainz': 90, 'spotify': 30, 'discogs': 60},
+        'lookup_cache_negative_ttl_days': 3,
+        'artist_cache': True,        # Cache persistant des artistes résolus (même fichier)
+        'artist_cache_size': 20000,  # Artistes résolus (nom de tri, identifiant MusicBrainz)
+        'artist_cache_ttl_days': 180,
+        'fuzzy_index': True,         # Index local des artistes et labels connus (variantes d'écriture)
+        'fuzzy_min_similarity': 0.85,
+        'not_found_cache': True,     # Mémoire persistante des albums introuvables (même fichier)
+        'not_found_ttl_days': 30,    # Albums introuvables non recherchés de nouveau pendant ce délai
+        'deferred_retry_budget': 300,  # Temps maximal (s) des nouvelles tentatives en fin de traitement
+        'provider_timeout': 30,      # Délai maximal (s) accordé à chaque fournisseur
+        'provider_workers': 8,       # Threads d'interrogation simultanée des fournisseurs
+        # Ordre d'interrogation des fournisseurs et nombre interrogés en même temps
+        # (None : pas de limite autre que l'échelonnement)
+        'provider_order': ['musicbrainz', 'spotify', 'discogs'],
+        'provider_parallelism': None,
+        # Délai (s) avant de lancer le fournisseur suivant si le précédent n'a pas encore
+        # répondu ; 0 pour les interroger tous à la fois
+        'provider_hedge_delay': 2.0,
+        # Confiance minimale (avec label) pour accepter un résultat sans interroger
+        # les fournisseurs suivants ; None pour toujours les interroger tous
+        'accept_confidence': 90,
+        # Ordre adaptatif : fournisseurs lancés par valeur attendue (label obtenu par
+        # seconde d'attente) une fois assez de mesures collectées, avec un délai
+        # d'échelonnement déduit de leur latence mesurée ; ceux dont le taux de label
+        # reste sous le seuil sont ignorés, sauf pour une part d'exploration
+        'adaptive_order': True,
+        'adaptive_min_samples': 20,
+        'adaptive_skip_below': 0.05,
+        'adaptive_explore': 0.05,
+        # Débit maximal par service : [requêtes, période en secondes]
+        'rate_limits': {'musicbrainz': [1, 1], 'spotify': [10, 1], 'discogs': [60, 60]},
+        # Nouvelles tentatives par fournisseur (attente exponentielle avec gigue)
+        'retry': {'max_attempts': 3, 'base_delay': 1.0, 'max_delay': 30, 'max_total': 20},
+        # Niveaux de log par sous-système (app, match, providers, writer) ou par nom de logger
+        'log_levels': {'match': 'WARNING', 'providers': 'INFO', 'writer': 'INFO', 'musicbrainzngs': 'WARNING'},
+        'album_cache_size': 2048,    # Détails d'albums gardés en mémoire (par identifiant)
+        # Disjoncteur par fournisseur : suspension après N échecs consécutifs, pause en secondes
+        'circuit_breaker': {'failure_threshold': 5, 'cooldown': 120},
+    }
+
     def __init__(self, locale_manager):
         self.locale_manager = locale_manager
         self.config: Dict[str, Any] = self.load_config()
+        self.apply_log_levels(self.config)
+
+    @classmethod
+    def apply_log_levels(cls, config: Dict[str, Any]) -> None:
+        """Applique la verbosité par sous-système (valeurs par défaut complétées par la configuration)."""
+        levels = dict(cls.DEFAULT_PERFORMANCE['log_levels'])
+        levels.update(cls.performance_setting(config, 'log_levels'))
+        apply_log_levels(levels, __name__)
+
+    @classmethod
+    def rate_limits(cls, config: Dict[str, Any]) -> Dict[str, Any]:
+        """Limites de débit par service (valeurs par défaut complétées par la configuration).
+
+        Un service absent de la configuration garde sa limite par défaut : sans elle,
+        ses requêtes ne seraient plus limitées du tout.
+        """
+        limits = dict(cls.DEFAULT_PERFORMANCE['rate_limits'])
+        limits.update(cls.performance_setting(config, 'rate_limits'))
+        return limits
+
+    @classmethod
+    def performance_setting(cls, config: Dict[str, Any], key: str) -> Any:
+        """Retourne un réglage de performance (configuration ou valeur par défaut)."""
+        return config.get('performance', {}).get(key, cls.DEFAULT_PERFORMANCE[key])
 
     def load_config(self) -> Dict[str, Any]:
             default_config = {
@@ -62,7 +153,8 @@ class ConfigManager:
                     'musicbrainz': True,     # MusicBrainz activé par défaut
                     'spotify': False,         # Spotify désactivé par défaut
                     'discogs': False          # Discogs désactivé par défaut
-                }
+                },
+                'performance': dict(self.DEFAULT_PERFORMANCE)
             }
             try:
                 if Path(self.CONFIG_FILE).exists():
@@ -71,6 +163,11 @@ class ConfigManager:
                         # S'assurer que la section services existe avec les valeurs par défaut
                         if 'services' not in loaded_config:
                             loaded_config['services'] = default_config['services']
+                        # Compléter les réglages de performance manquants
+                        loaded_config['performance'] = {
+                            **self.DEFAULT_PERFORMANCE,
+                            **loaded_config.get('performance', {})
+                        }
                         return loaded_config
             except Exception as e:
                 logger.error(self.locale_manager.get_text("messages.error.config_loading", None, str(e)))
@@ -149,13 +246,53 @@ class ConfigManager:
 class APIManager:
     """Gestionnaire centralisé des APIs musicales."""
 
-    def __init__(self, config: Dict[str, str], locale_manager):
+    # Fournisseurs : (service, méthode de recherche, nom affiché)
+    PROVIDERS = [
+        ('musicbrainz', '_search_musicbrainz', "MusicBrainz"),
+        ('spotify', '_search_spotify', "Spotify"),
+        ('discogs', '_search_discogs', "Discogs")
+    ]
+
+    def __init__(self, config: Dict[str, str], locale_manager,
+                 status_callback: Optional[Callable[[str], None]] = None):
         self.config = config
         self.locale_manager = locale_manager
+        ConfigManager.apply_log_levels(config)
+        # Messages d'état des fournisseurs destinés au journal de l'interface
+        self.status_callback = status_callback
         self.spotify = None
         self.discogs = None
         self.musicbrainz = None
+        self.lookup_cache: Optional[LookupCache] = None
+        self.artist_cache: Optional[ArtistCache] = None
+        self.not_found_cache: Optional[NotFoundCache] = None
+        self._search_flight = SingleFlight()
+        # Artistes et labels connus (tags de la bibliothèque, résultats acceptés)
+        self.artist_index: Optional[FuzzyIndex] = None
+        self.label_index: Optional[FuzzyIndex] = None
+        if self._performance_setting('fuzzy_index'):
+            min_similarity = self._performance_setting('fuzzy_min_similarity')
+            self.artist_index = FuzzyIndex(min_similarity)
+            self.label_index = FuzzyIndex(min_similarity)
+        self.provider_stats: Optional[ProviderStats] = None
+        # Détails d'albums Spotify déjà récupérés, par identifiant d'album
+        self._spotify_albums = LRUCache(self._performance_setting('album_cache_size'))
+        # Releases MusicBrainz (avec labels) déjà récupérées, par identifiant de release
+        self._musicbrainz_releases = LRUCache(self._performance_setting('album_cache_size'))
+        # Toutes les requêtes vers les fournisseurs passent par ce limiteur partagé
+        self.rate_limiter = RateLimiter(ConfigManager.rate_limits(self.config))
+        breaker_settings = self._performance_setting('circuit_breaker')
+        self.breakers = {
+            service_name: CircuitBreaker(display_name, on_state_change=self._on_breaker_change, **breaker_settings)
+            for service_name, _, display_name in self.PROVIDERS
+        }
         self._init_apis()
+        self._init_lookup_cache()
+        self._init_provider_stats()
+        self._provider_executor = ThreadPoolExecutor(
+            max_workers=self._performance_setting('provider_workers'),
+            thread_name_prefix='amtu-provider'
+        )
 
     def _init_apis(self):
         """Initialise toutes les connexions APIs."""
@@ -169,7 +306,12 @@ class APIManager:
                 client_id=self.config['spotify_client_id'],
                 client_secret=self.config['spotify_client_secret']
             )
-            self.spotify = spotipy.Spotify(auth_manager=auth_manager)
+            # Session sans nouvelles tentatives internes : RetryPolicy s'en charge en
+            # respectant le Retry-After transmis avec l'erreur
+            self.spotify = spotipy.Spotify(
+                auth_manager=auth_manager,
+                requests_session=requests.Session()
+            )
         except Exception as e:
             logger.error(self.locale_manager.get_text(
                 "api.initialization.error.spotify",
@@ -189,6 +331,8 @@ class APIManager:
                 consumer_secret=self.config.get('discogs_consumer_secret', discogs_config.get('consumer_secret', '')),
                 token=self.config.get('discogs_token', discogs_config.get('token', ''))
             )
+            # Les erreurs 429 remontent à RetryPolicy au lieu d'être réessayées en boucle
+            self.discogs.backoff_enabled = False
         except Exception as e:
             logger.error(self.locale_manager.get_text(
                 "api.initialization.error.discogs",
@@ -199,7 +343,8 @@ class APIManager:
 
     def _init_musicbrainz(self):
         try:
-            logging.getLogger('musicbrainzngs').setLevel(logging.WARNING)
+            # Le débit est géré par notre RateLimiter, partagé entre les threads
+            musicbrainzngs.set_rate_limit(False)
             musicbrainzngs.set_useragent(
                 "MetadataManager",
                 "1.0",
@@ -215,324 +360,669 @@ class APIManager:
             ))
             raise
 
-    def search_track(self, title: str, artist: str, retries: int = 3) -> List[TrackMetadata]:
-        """Recherche les métadonnées avec plusieurs tentatives en cas d'échec."""
+    def _performance_setting(self, key: str) -> Any:
+        return ConfigManager.performance_setting(self.config, key)
+
+    def _init_lookup_cache(self):
+        """Ouvre les caches persistants activés (résultats, artistes, albums introuvables).
+
+        Chacun a son propre réglage : désactiver le cache des résultats ne désactive
+        ni le cache d'artistes ni la mémoire des albums introuvables.
+        """
+        cache_file = self._performance_setting('lookup_cache_file')
+
+        if self._performance_setting('lookup_cache'):
+            try:
+                self.lookup_cache = LookupCache(
+                    cache_file,
+                    max_entries=self._performance_setting('lookup_cache_size'),
+                    ttl_days=self._performance_setting('lookup_cache_ttl_days'),
+                    negative_ttl_days=self._performance_setting('lookup_cache_negative_ttl_days')
+                )
+            except Exception as e:
+                logger.warning(f"Cache de recherche indisponible: {e}")
+                self.lookup_cache = None
+
+        if self._performance_setting('artist_cache'):
+            try:
+                self.artist_cache = ArtistCache(
+                    cache_file,
+                    max_entries=self._performance_setting('artist_cache_size'),
+                    ttl_days=self._performance_setting('artist_cache_ttl_days')
+                )
+            except Exception as e:
+                logger.warning(f"Cache d'artistes indisponible: {e}")
+                self.artist_cache = None
+
+        if self._performance_setting('not_found_cache'):
+            try:
+                self.not_found_cache = NotFoundCache(
+                    cache_file,
+                    ttl_days=self._performance_setting('not_found_ttl_days')
+                )
+            except Exception as e:
+                logger.warning(f"Mémoire des albums introuvables indisponible: {e}")
+                self.not_found_cache = None
+
+    def _on_breaker_change(self, breaker: CircuitBreaker, previous: str, state: str) -> None:
+        """Signale les changements d'état d'un disjoncteur dans les logs et l'interface."""
+        if state == OPEN:
+            message = self.locale_manager.get_text(
+                "api.circuit.opened", None, breaker.name, breaker.failures, breaker.cooldown
+            )
+        else:
+            message = self.locale_manager.get_text(f"api.circuit.{state}", None, breaker.name)
+        logger.warning(message)
+        if self.status_callback:
+            self.status_callback(message)
+
+    def _init_provider_stats(self):
+        """Charge les statistiques persistantes des fournisseurs si l'ordre adaptatif est activé."""
+        if not self._performance_setting('adaptive_order'):
+            return
+        try:
+            self.provider_stats = ProviderStats(self._performance_setting('lookup_cache_file'))
+        except Exception as e:
+            logger.warning(f"Statistiques des fournisseurs indisponibles: {e}")
+            self.provider_stats = None
+
+    def breaker_wait(self) -> float:
+        """Temps (s) avant que les fournisseurs activés suspendus par leur disjoncteur acceptent un essai."""
+        enabled_services = self.config.get('services', {})
+        return max((breaker.retry_in() for service_name, breaker in self.breakers.items()
+                    if enabled_services.get(service_name, False)), default=0.0)
+
+    def flush_provider_stats(self) -> None:
+        if self.provider_stats:
+            self.provider_stats.flush()
+
+    def index_library(self, tracks: Iterable[TrackMetadata], album_rank: int) -> None:
+        """Ajoute les artistes et labels des tags d'un album à l'index local.
+
+        album_rank est le rang de l'album dans l'ordre du scan : la recherche d'un
+        album ne voit que les albums de rang inférieur, quel que soit l'avancement
+        du scan ou des autres recherches au moment où elle a lieu.
+        """
+        if self.artist_index is None:
+            return
+        for track in tracks:
+            self.artist_index.add(track.artist, sequence=album_rank)
+            if track.album_artist and track.album_artist != track.artist:
+                self.artist_index.add(track.album_artist, sequence=album_rank)
+            self.label_index.add(track.label, sequence=album_rank)
+
+    def _canonical_artist(self, artist: str, album_rank: Optional[int]) -> str:
+        """Remplace dans la chaîne d'artistes les variantes isolées d'artistes connus.
+
+        Seul le nom concerné change : les autres artistes crédités (feat., &...) et
+        le reste de la chaîne sont conservés tels quels.
+        """
+        pieces, cursor = [], 0
+        for part in split_artists(artist):
+            start = artist.find(part, cursor)
+            if start < 0:
+                continue
+            canonical = self.artist_index.canonical(part, before=album_rank)
+            if canonical and canonical != part:
+                provider_logger.info("Artiste normalisé: '%s' -> '%s'", part, canonical)
+                pieces.extend((artist[cursor:start], canonical))
+                cursor = start + len(part)
+        return ''.join(pieces) + artist[cursor:] if pieces else artist
+
+    def _candidate_prior(self, candidate: TrackMetadata, album_rank: Optional[int]) -> int:
+        """Départage les candidats de même confiance : artiste et label déjà connus d'abord."""
+        if self.artist_index is None:
+            return 0
+        return (int(self.artist_index.contains(candidate.artist, before=album_rank))
+                + int(self.label_index.contains(candidate.label, before=album_rank)))
+
+    def warm_artist_cache(self, tracks: Iterable[TrackMetadata]) -> int:
+        """Préchauffe le cache d'artistes avec les noms de tri déjà présents dans les tags."""
+        if not self.artist_cache:
+            return 0
+        return self.artist_cache.put_many(
+            ((track.artist, track.artist_sort, track.musicbrainz_artist_id) for track in tracks),
+            replace=False
+        )
+
+    def search_track(self, title: str, artist: str, retries: Optional[int] = None,
+                     album_rank: Optional[int] = None) -> List[TrackMetadata]:
+        """Recherche les métadonnées.
+
+        retries remplace le nombre maximal de tentatives par fournisseur ; par défaut,
+        le réglage performance.retry.max_attempts s'applique. album_rank limite l'index
+        local aux albums qui précèdent celui-ci dans l'ordre du scan (tout l'index si None).
+        """
         logger.info(self.locale_manager.get_text(
             "api.initialization.search.start",
             None,
             title,
             artist
         ))
-        for attempt in range(retries):
-            try:
-                results = self._execute_search(title, artist)
-                if results:
-                    return results
-            except Exception as e:
-                logger.warning(self.locale_manager.get_text(
-                    "api.initialization.search.attempt_failed",
-                    None,
-                    attempt + 1,
-                    retries,
-                    str(e)
-                ))
-                if attempt == retries - 1:
-                    logger.error(self.locale_manager.get_text(
-                        "api.initialization.search.all_attempts_failed",
-                        None,
-                        title,
-                        artist
-                    ))
-                    raise
-                time.sleep(1)
-        return []
+        # Variante d'écriture isolée d'un artiste connu : on interroge avec la graphie de référence
+        if self.artist_index is not None and artist:
+            artist = self._canonical_artist(artist, album_rank)
+        # Les recherches identiques simultanées partagent un seul appel aux fournisseurs ;
+        # les nouvelles tentatives sont gérées fournisseur par fournisseur
+        results = self._search_flight.do(
+            LookupCache.make_key(title, artist),
+            lambda: self._execute_search(title, artist, retries)
+        )
+        # Égalités départagées hors de l'appel partagé, avec l'index vu par cet album
+        return merge_ranked([results], lambda candidate: self._candidate_prior(candidate, album_rank))[:1]
 
-    def _execute_search(self, title: str, artist: str) -> List[TrackMetadata]:
-        """Exécute la recherche sur les APIs activées."""
-        best_result = None
-        enabled_services = self.config.get('services', {})
+    def _ordered_providers(self) -> List[Tuple[str, str, str]]:
+        """Fournisseurs activés, dans l'ordre de lancement.
 
-        for service_name, search_func, display_name in [
-            ('musicbrainz', self._search_musicbrainz, "MusicBrainz"),
-            ('spotify', self._search_spotify, "Spotify"),
-            ('discogs', self._search_discogs, "Discogs")
-        ]:
-            if not enabled_services.get(service_name, False):
+        Ordre configuré (les autres à la suite, ordre par défaut), remplacé par le
+        classement par valeur attendue une fois assez de mesures collectées. Le
+        premier est lancé seul ; les suivants sont retenus tant qu'il n'a pas répondu
+        sans résultat acceptable ou dépassé son délai d'échelonnement.
+        """
+        enabled_services = self.config.get('services', {})
+        order = list(self._performance_setting('provider_order'))
+        providers = [provider for provider in self.PROVIDERS if enabled_services.get(provider[0], False)]
+        providers = sorted(providers, key=lambda p: order.index(p[0]) if p[0] in order else len(order))
+        if not self.provider_stats:
+            return providers
+
+        min_samples = self._performance_setting('adaptive_min_samples')
+        by_name = {provider[0]: provider for provider in providers}
+        ranked = [by_name[name] for name in self.provider_stats.rank(list(by_name), min_samples)]
+
+        # Ignore les fournisseurs qui ne donnent presque jamais de label, en gardant
+        # une petite part d'exploration pour que leurs statistiques puissent évoluer
+        threshold = self._performance_setting('adaptive_skip_below')
+        explore = random.random() < self._performance_setting('adaptive_explore')
+        kept = []
+        for provider in ranked:
+            stat = self.provider_stats.get(provider[0])
+            if (not explore and stat.samples >= min_samples
+                    and stat.success_rate * stat.label_rate < threshold):
+                provider_logger.info("%s ignoré (taux de label: %.0f%%)", provider[2], stat.label_rate * 100)
                 continue
+            kept.append(provider)
+        # Au moins un fournisseur reste interrogé
+        return kept or ranked[:1]
+
+    # Marge appliquée à la latence mesurée d'un fournisseur pour fixer son délai d'échelonnement
+    HEDGE_LATENCY_FACTOR = 2.0
+
+    def _hedge_delay(self, service_name: str) -> float:
+        """Délai laissé à un fournisseur avant de lancer le suivant sans attendre sa réponse.
+
+        Avec l'ordre adaptatif et assez de mesures, il est déduit de la latence
+        mesurée du fournisseur : un fournisseur rapide qui répond d'habitude est
+        seul interrogé, les suivants ne partent que s'il tarde anormalement.
+        Sinon, provider_hedge_delay s'applique (0 : tous interrogés à la fois).
+        """
+        configured = max(0.0, float(self._performance_setting('provider_hedge_delay')))
+        if self.provider_stats and configured > 0:
+            stat = self.provider_stats.get(service_name)
+            if stat.samples >= self._performance_setting('adaptive_min_samples'):
+                return stat.latency * self.HEDGE_LATENCY_FACTOR
+        return configured
+
+    # Confiance minimale (avec label) pour qu'un résultat soit écrit dans les tags
+    MIN_CONFIDENCE = 60
+
+    def _is_accepted(self, result: TrackMetadata) -> bool:
+        """Politique d'acceptation : un résultat suffisant dispense d'interroger les autres fournisseurs."""
+        threshold = self._performance_setting('accept_confidence')
+        return threshold is not None and bool(result.label) and result.confidence >= threshold
+
+    def _execute_search(self, title: str, artist: str, retries: Optional[int] = None) -> List[TrackMetadata]:
+        """Exécute la recherche sur les APIs activées.
+
+        Les fournisseurs sont lancés un par un, dans l'ordre : le suivant part quand
+        le précédent a répondu sans résultat acceptable, ou quand son délai
+        d'échelonnement (provider_hedge_delay) est écoulé sans réponse. Au plus
+        provider_parallelism fournisseurs sont en cours, chacun avec un délai maximal.
+        Les candidats de tous les fournisseurs sont classés ensemble : le meilleur
+        candidat avec label l'emporte. Les candidats avec label à égalité sont tous
+        retournés, dans l'ordre des fournisseurs, pour que search_track les départage.
+
+        Un résultat qui satisfait la politique d'acceptation arrête la recherche :
+        les fournisseurs non lancés sont ignorés et ceux en cours abandonnent leurs
+        nouvelles tentatives. Un fournisseur n'étant lancé qu'après la réponse du
+        précédent ou l'expiration de son délai, un résultat n'est jamais accepté
+        pendant qu'un fournisseur mieux placé dispose encore de son délai.
+
+        Si un fournisseur a échoué et qu'aucun résultat n'est exploitable (pas de
+        label ou confiance sous MIN_CONFIDENCE), l'absence de résultat n'est pas
+        concluante : TransientLookupError est levée pour un échec temporaire (délai,
+        limitation, disjoncteur ouvert), ProviderLookupError pour un échec définitif
+        (jeton refusé, erreur inattendue).
+        """
+        best_result = None
+        ranked: List[TrackMetadata] = []
+        # Candidats reçus, par rang du fournisseur
+        candidates: Dict[int, List[TrackMetadata]] = {}
+        transient_failure = False
+        failed_providers = []
+        providers = self._ordered_providers()
+        parallelism = max(1, int(self._performance_setting('provider_parallelism') or len(providers)))
+        timeout = self._performance_setting('provider_timeout')
+        hedges = [self._hedge_delay(provider[0]) for provider in providers]
+        stop_event = threading.Event()
+        # future -> (rang du fournisseur, nom affiché, lancement, échéance)
+        pending: Dict[Any, Tuple[int, str, float, float]] = {}
+        launched = 0
+        last_future = None
+        finished = 0
+
+        def launch() -> None:
+            nonlocal launched, last_future
+            service_name, method_name, display_name = providers[launched]
+            started = time.monotonic()
+            last_future = self._provider_executor.submit(
+                self._query_provider, service_name, getattr(self, method_name), display_name,
+                title, artist, retries, stop_event.is_set
+            )
+            pending[last_future] = (launched, display_name, started, started + timeout)
+            launched += 1
+
+        def next_launch_at() -> Optional[float]:
+            """Moment où le fournisseur suivant peut partir (None : aucun à lancer pour l'instant)."""
+            if launched >= len(providers) or len(pending) >= parallelism:
+                return None
+            if last_future not in pending:
+                # Le précédent a répondu sans résultat acceptable
+                return time.monotonic()
+            return pending[last_future][2] + hedges[launched - 1]
 
-            logger.info(f"Recherche sur {display_name}...")
-            try:
-                results = search_func(title, artist)
+        try:
+            while pending or launched < len(providers):
+                if best_result and self._is_accepted(best_result):
+                    skipped = len(providers) - finished
+                    if skipped:
+                        provider_logger.info("Résultat accepté (%s, confiance: %s%%): %d fournisseur(s) ignoré(s)",
+                                             best_result.source, best_result.confidence, skipped)
+                    break
 
-                if not results:
+                wake = next_launch_at()
+                if wake is not None and wake <= time.monotonic():
+                    launch()
                     continue
 
-                logger.info(f"Résultats trouvés sur {display_name}: {len(results)}")
-
-                # Trouve le meilleur résultat pour ce service
-                current_best = max(results, key=lambda x: x.confidence)
-
-                if current_best.label:  # On vérifie seulement la présence du label
-                    # Si c'est notre premier résultat valide ou s'il est meilleur que le précédent
-                    if not best_result or current_best.confidence > best_result.confidence:
-                        best_result = current_best
-                        logger.info(f"Nouveau meilleur résultat trouvé sur {display_name} "
-                                  f"(confiance: {current_best.confidence}%)")
-
-            except Exception as e:
-                logger.warning(f"Erreur lors de la recherche sur {display_name}: {e}")
-                continue
+                next_deadline = min(deadline for _, _, _, deadline in pending.values())
+                wake = next_deadline if wake is None else min(wake, next_deadline)
+                done, _ = wait(list(pending), timeout=max(0.0, wake - time.monotonic()),
+                               return_when=FIRST_COMPLETED)
+
+                now = time.monotonic()
+                for future, (_, display_name, _, deadline) in list(pending.items()):
+                    if future not in done and deadline <= now:
+                        del pending[future]
+                        future.cancel()
+                        finished += 1
+                        transient_failure = True
+                        failed_providers.append(display_name)
+                        logger.warning(f"Délai dépassé lors de la recherche sur {display_name}")
+
+                for future in done:
+                    index, display_name, _, _ = pending.pop(future)
+                    finished += 1
+                    try:
+                        results = future.result()
+                    except CircuitOpenError as e:
+                        transient_failure = True
+                        failed_providers.append(display_name)
+                        logger.debug(str(e))
+                        continue
+                    except Exception as e:
+                        transient_failure = transient_failure or is_retryable(e)
+                        failed_providers.append(display_name)
+                        logger.warning(f"Erreur lors de la recherche sur {display_name}: {e}")
+                        continue
+
+                    if results:
+                        provider_logger.info("Résultats trouvés sur %s: %d", display_name, len(results))
+                        candidates[index] = results
+
+                        # Classement commun sur les scores déjà calculés (tri stable :
+                        # fournisseurs dans l'ordre configuré)
+                        ranked = merge_ranked(candidates[rank] for rank in sorted(candidates))
+                        if match_logger.isEnabledFor(logging.DEBUG):
+                            for candidate in ranked:
+                                match_logger.debug("Candidat %s: '%s' - %s (confiance: %.1f%%, label: %s)",
+                                                   candidate.source, candidate.title, candidate.artist,
+                                                   candidate.confidence, candidate.label)
+
+                        # On vérifie seulement la présence du label
+                        current_best = next((candidate for candidate in ranked if candidate.label), None)
+                        if current_best is not None and current_best is not best_result:
+                            best_result = current_best
+                            provider_logger.info("Nouveau meilleur résultat trouvé sur %s (confiance: %s%%)",
+                                                 best_result.source, best_result.confidence)
+        finally:
+            # Les fournisseurs encore en file sont annulés, ceux en cours s'arrêtent
+            # avant leur prochaine tentative
+            stop_event.set()
+            for future in pending:
+                future.cancel()
+
+        if failed_providers and (not best_result or best_result.confidence < self.MIN_CONFIDENCE):
+            failed = ', '.join(failed_providers)
+            if transient_failure:
+                raise TransientLookupError(f"Erreur temporaire des fournisseurs pour '{title}' - {artist} ({failed})")
+            raise ProviderLookupError(f"Échec des fournisseurs pour '{title}' - {artist} ({failed})")
 
         if best_result:
-            logger.info(f"Meilleur résultat final : {best_result.source} "
-                       f"(confiance: {best_result.confidence}%)")
-            return [best_result]
-
-        logger.info("Aucun résultat valide trouvé")
+            provider_logger.info("Meilleur résultat final : %s (confiance: %s%%)",
+                                 best_result.source, best_result.confidence)
+            # Les candidats avec label à égalité sont tous rendus (ordre des fournisseurs) :
+            # search_track les départage selon l'index local vu par l'album
+            return [candidate for candidate in ranked
+                    if candidate.label and candidate.confidence == best_result.confidence]
+
+        provider_logger.info("Aucun résultat valide trouvé")
         return []
 
-    def _search_spotify(self, title: str, artist: str) -> List[TrackMetadata]:
-        results = []
-        query = f"track:\"{title}\" artist:\"{artist}\""
+    # Fournisseurs qui notent eux-mêmes leurs candidats (MusicBrainz choisit ainsi
+    # la release à détailler) ; les autres renvoient des candidats bruts
+    SELF_RANKED_PROVIDERS = {'musicbrainz'}
+
+    def _query_provider(self, service_name: str, search_func, display_name: str,
+                        title: str, artist: str, retries: Optional[int] = None,
+                        should_stop: Optional[Callable[[], bool]] = None) -> List[TrackMetadata]:
+        """Interroge un fournisseur en passant par le cache de recherche.
+
+        Les erreurs temporaires sont réessayées selon la politique propre au
+        fournisseur ; les erreurs définitives sont propagées et ne sont jamais mises
+        en cache. Une recherche aboutie sans résultat est mémorisée comme entrée négative.
+        should_stop signale que la recherche n'a plus besoin de ce fournisseur.
+        """
+        if should_stop and should_stop():
+            return []
+
+        if self.lookup_cache:
+            cached = self.lookup_cache.get(service_name, title, artist)
+            if cached is not None:
+                provider_logger.info("%s - Résultats servis par le cache: %d", display_name, len(cached))
+                return cached
+
+        breaker = self.breakers[service_name]
+        if not breaker.allow():
+            raise CircuitOpenError(f"{display_name} suspendu ({breaker.retry_in():.0f}s restantes)")
+
+        provider_logger.info("Recherche sur %s...", display_name)
+        policy = self._retry_policy(retries)
+
+        def on_retry(attempt: int, delay: float, error: BaseException) -> None:
+            logger.warning(self.locale_manager.get_text(
+                "api.initialization.search.attempt_failed",
+                None,
+                attempt,
+                policy.max_attempts,
+                str(error)
+            ) + f" [{display_name}, nouvel essai dans {delay:.1f}s]")
 
+        started = time.monotonic()
         try:
-            search_results = self.spotify.search(query, type='track', limit=5)
-
-            if 'tracks' in search_results and 'items' in search_results['tracks']:
-                for track in search_results['tracks']['items']:
-                    album = track['album']
-                    confidence = self._calculate_confidence(
-                        title, artist,
-                        track['name'], track['artists'][0]['name']
-                    )
-
-                    album_detail = self.spotify.album(album['id'])
-                    label = album_detail.get('label')
-
-                    logger.info(f"Spotify - Détails album - Titre: {album_detail.get('name')}, Label: {label}")
-
-                    metadata = TrackMetadata(
-                        title=track['name'],
-                        artist=track['artists'][0]['name'],
-                        album=album['name'],
-                        label=label,
-                        confidence=confidence,
-                        source="Spotify"
-                    )
-                    results.append(metadata)
+            results = policy.run(
+                lambda: search_func(title, artist),
+                retry_hint=lambda error: self._retry_hint(service_name, error),
+                on_retry=on_retry,
+                should_stop=should_stop
+            )
+        except Exception:
+            if should_stop and should_stop():
+                # Arrêté entre deux tentatives parce qu'un résultat a été accepté :
+                # ce n'est pas un échec du fournisseur
+                provider_logger.info("%s - Recherche abandonnée (résultat déjà accepté)", display_name)
+                return []
+            breaker.record_failure()
+            if self.provider_stats:
+                self.provider_stats.record(service_name, False, False, time.monotonic() - started)
+            logger.error(self.locale_manager.get_text(
+                "api.initialization.search.all_attempts_failed",
+                None,
+                title,
+                artist
+            ) + f" [{display_name}]")
+            raise
 
-            logger.info(f"Spotify - Nombre de résultats: {len(results)}")
-            for result in results:
-                logger.info(f"Spotify - Résultat: Label={result.label}, Album={result.album}")
+        if service_name not in self.SELF_RANKED_PROVIDERS:
+            # Score du lot en un seul passage, une seule fois, à son arrivée
+            results = rank_candidates(title, artist, results)
 
-        except Exception as e:
-            logger.error(f"Erreur Spotify: {e}")
+        breaker.record_success()
+        if self.provider_stats:
+            label_hit = bool(results) and bool(max(results, key=lambda x: x.confidence).label)
+            self.provider_stats.record(service_name, True, label_hit, time.monotonic() - started)
 
+        if self.lookup_cache:
+            self.lookup_cache.put(service_name, title, artist, results)
         return results
 
-    def _search_discogs(self, title: str, artist: str) -> List[TrackMetadata]:
-        results = []
+    def _retry_policy(self, retries: Optional[int] = None) -> RetryPolicy:
+        settings = dict(self._performance_setting('retry'))
+        if retries is not None:
+            settings['max_attempts'] = retries
+        return RetryPolicy(**settings)
+
+    def _retry_hint(self, service_name: str, error: BaseException) -> Optional[float]:
+        """Délai imposé par le fournisseur avant une nouvelle tentative, s'il est connu."""
+        hint = retry_after(error)
+        if hint is not None:
+            return hint
+        if service_name == 'discogs' and http_status(error) == 429 and self.discogs:
+            # Discogs n'envoie pas de Retry-After mais indique sa fenêtre glissante
+            fetcher = getattr(self.discogs, '_fetcher', None)
+            limit = getattr(fetcher, 'rate_limit', None)
+            if getattr(fetcher, 'rate_limit_remaining', None) == '0' and limit:
+                return 60.0 / max(1, int(limit))
+        return None
 
-        try:
-            search_results = self.discogs.search(
-                f"{title} {artist}",
-                type='release',
-                format='album'
-            )
+    # Nombre maximal d'identifiants acceptés par l'endpoint albums de Spotify
+    SPOTIFY_ALBUMS_BATCH = 20
 
-            for release in list(search_results)[:5]:
-                try:
-                    artist_name = release.artists[0].name if release.artists else "Unknown Artist"
-                    label_name = release.labels[0].name if release.labels else None
-                    catalog_num = release.labels[0].catno if release.labels else None
-
-                    confidence = self._calculate_confidence(
-                        title, artist,
-                        release.title,
-                        artist_name
-                    )
+    def _spotify_album_details(self, album_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Récupère les détails de plusieurs albums en une requête, via le cache mémoire."""
+        missing = [album_id for album_id in dict.fromkeys(album_ids) if album_id not in self._spotify_albums]
 
-                    metadata = TrackMetadata(
-                        title=release.title,
-                        artist=artist_name,
-                        album=release.title,
-                        label=label_name,
-                        catalog_number=catalog_num,
-                        confidence=confidence,
-                        source="Discogs"
-                    )
-                    results.append(metadata)
+        for start in range(0, len(missing), self.SPOTIFY_ALBUMS_BATCH):
+            batch = missing[start:start + self.SPOTIFY_ALBUMS_BATCH]
+            self.rate_limiter.acquire('spotify')
+            response = self.spotify.albums(batch)
+            for album_id, album_detail in zip(batch, response.get('albums', [])):
+                self._spotify_albums.put(album_id, album_detail or {})
 
-                except (AttributeError, IndexError) as e:
-                    logger.debug(f"Erreur lors du traitement d'un résultat Discogs: {e}")
-                    continue
+        return {album_id: self._spotify_albums.get(album_id, {}) for album_id in album_ids}
 
-        except Exception as e:
-            logger.warning(f"Erreur Discogs: {e}")
+    def _search_spotify(self, title: str, artist: str) -> List[TrackMetadata]:
+        results = []
+        query = f"track:\"{title}\" artist:\"{artist}\""
 
-        return results
+        # Les erreurs d'API sont propagées à _query_provider (pas de mise en cache)
+        self.rate_limiter.acquire('spotify')
+        search_results = self.spotify.search(query, type='track', limit=5)
 
-    def _search_musicbrainz(self, title: str, artist: str) -> List[TrackMetadata]:
-            """Recherche sur MusicBrainz avec nettoyage des titres."""
-            logger.info(f"MusicBrainz - Début de recherche pour titre='{title}' artist='{artist}'")
-            results = []
+        if 'tracks' in search_results and 'items' in search_results['tracks']:
+            tracks = search_results['tracks']['items']
+            # Une seule requête pour les labels de tous les albums candidats
+            album_details = self._spotify_album_details([track['album']['id'] for track in tracks])
 
-            try:
-                # Nettoyer le titre pour la recherche
-                clean_title = title.split('(')[0].strip()  # Enlever tout ce qui est entre parenthèses
-                clean_artist = artist.split('&')[0].strip()  # Prendre seulement le premier artiste
+            for track in tracks:
+                album = track['album']
+                album_detail = album_details[album['id']]
+                label = album_detail.get('label')
 
-                logger.info(f"MusicBrainz - Recherche avec titre nettoyé: '{clean_title}' artiste: '{clean_artist}'")
+                provider_logger.debug("Spotify - Détails album - Titre: %s, Label: %s", album_detail.get('name'), label)
 
-                search_results = self.musicbrainz.search_recordings(
-                    query=f'recording:"{clean_title}" AND artist:"{clean_artist}"',
-                    limit=5
+                metadata = TrackMetadata(
+                    title=track['name'],
+                    artist=track['artists'][0]['name'],
+                    album=album['name'],
+                    label=label,
+                    source="Spotify"
                 )
+                results.append(metadata)
 
-                # Recherche de l'artiste pour le tri
-                artist_result = self.musicbrainz.search_artists(clean_artist, limit=1)
-                artist_sort_name = None
-                if 'artist-list' in artist_result and artist_result['artist-list']:
-                    artist_sort_name = artist_result['artist-list'][0].get('sort-name', clean_artist)
-                    logger.info(f"MusicBrainz - Nom de tri trouvé: {artist_sort_name}")
-
-                if 'recording-list' in search_results:
-                    for recording in search_results['recording-list']:
-                        if 'release-list' in recording and recording['release-list']:
-                            release = recording['release-list'][0]
-                            release_id = release['id']
-                            logger.info(f"MusicBrainz - ID de la release trouvé: {release_id}")
-
-                            # Récupération des détails de la release
-                            release_details = self.musicbrainz.get_release_by_id(
-                                release_id,
-                                includes=['labels']
-                            )
+        provider_logger.info("Spotify - Nombre de résultats: %d", len(results))
+        if provider_logger.isEnabledFor(logging.DEBUG):
+            for result in results:
+                provider_logger.debug("Spotify - Résultat: Label=%s, Album=%s", result.label, result.album)
 
-                            actual_release = release_details.get('release', {})
-                            logger.info(f"MusicBrainz - Détails de la release récupérés")
-
-                            # Extraire le label et le numéro de catalogue
-                            label = None
-                            catalog_number = None
-
-                            if 'label-info-list' in actual_release:
-                                label_info = actual_release['label-info-list'][0]
-                                if 'label' in label_info:
-                                    label = label_info['label']['name']
-                                    logger.info(f"MusicBrainz - Label trouvé: {label}")
-                                if 'catalog-number' in label_info:
-                                    catalog_number = label_info['catalog-number']
-                                    logger.info(f"MusicBrainz - Numéro de catalogue trouvé: {catalog_number}")
-
-                            # Calculer la confiance avec le titre original
-                            confidence = self._calculate_confidence(
-                                title,
-                                artist,
-                                recording['title'],
-                                recording['artist-credit'][0]['artist']['name']
-                            )
+        return results
 
-                            metadata = TrackMetadata(
-                                title=recording['title'],
-                                artist=recording['artist-credit'][0]['artist']['name'],
-                                album=release.get('title', ''),
-                                label=label,
-                                catalog_number=catalog_number,
-                                confidence=confidence,
-                                source="MusicBrainz",
-                                artist_sort=artist_sort_name  # Ajout du champ de tri
-                            )
+    # Nombre de candidats Discogs demandés (une seule page de résultats)
+    DISCOGS_RESULTS = 5
 
-                            results.append(metadata)
-                            logger.info(f"MusicBrainz - Résultat ajouté: {metadata}")
+    def _search_discogs(self, title: str, artist: str) -> List[TrackMetadata]:
+        """Recherche sur Discogs en une seule requête.
 
-                # Trier les résultats par confiance
-                results.sort(key=lambda x: x.confidence, reverse=True)
-                if results:
-                    logger.info(f"MusicBrainz - Meilleur résultat: {results[0]}")
+        Les candidats sont construits à partir des données brutes de la page de
+        résultats (titre "Artiste - Titre", label, catno) : l'accès aux attributs
+        des objets Release déclencherait le chargement complet de chaque release.
+        """
+        results = []
 
-            except Exception as e:
-                logger.error(f"MusicBrainz - Erreur: {str(e)}")
-
-            return results
-
-    def _calculate_confidence(self, query_title: str, query_artist: str,
-                               result_title: str, result_artist: str) -> float:
-            """Calcule un score de confiance pour les résultats en nettoyant les titres."""
-            if not all([query_title, query_artist, result_title, result_artist]):
-                return 0.0
-
-            def clean_text(text: str) -> str:
-                """Nettoie le texte pour la comparaison."""
-                # Enlever tout ce qui est entre parenthèses
-                while '(' in text and ')' in text:
-                    start = text.find('(')
-                    end = text.find(')')
-                    if start < end:
-                        text = text[:start] + text[end + 1:]
-                    else:
-                        break
+        # Les erreurs d'API sont propagées à _query_provider (pas de mise en cache)
+        self.rate_limiter.acquire('discogs')
+        search_results = self.discogs.search(
+            f"{title} {artist}",
+            type='release',
+            format='album'
+        )
+        search_results.per_page = self.DISCOGS_RESULTS
 
-                # Nettoyer et normaliser le texte
-                text = text.lower().strip()
-                text = ''.join(c for c in text if c.isalnum() or c.isspace())
-                return text.strip()
+        for release in search_results.page(1)[:self.DISCOGS_RESULTS]:
+            try:
+                data = release.data
+                artist_name, separator, release_title = data['title'].partition(' - ')
+                if not separator:
+                    artist_name, release_title = "Unknown Artist", data['title']
+                labels = data.get('label') or []
+                label_name = labels[0] if labels else None
+                catalog_num = data.get('catno') if labels else None
+                if catalog_num == 'none':  # Valeur utilisée par Discogs pour "sans numéro"
+                    catalog_num = None
+
+                metadata = TrackMetadata(
+                    title=release_title,
+                    artist=artist_name,
+                    album=release_title,
+                    label=label_name,
+                    catalog_number=catalog_num,
+                    source="Discogs"
+                )
+                results.append(metadata)
 
-            # Nettoyer les textes pour la comparaison
-            query_title_clean = clean_text(query_title)
-            query_artist_clean = clean_text(query_artist.split('&')[0])  # Prendre le premier artiste
-            result_title_clean = clean_text(result_title)
-            result_artist_clean = clean_text(result_artist.split('&')[0])
+            except (AttributeError, KeyError, TypeError) as e:
+                provider_logger.debug("Erreur lors du traitement d'un résultat Discogs: %s", e)
+                continue
 
-            logger.info(f"Comparaison de titres: '{query_title_clean}' vs '{result_title_clean}'")
-            logger.info(f"Comparaison d'artistes: '{query_artist_clean}' vs '{result_artist_clean}'")
+        return results
 
-            # Ratio de similarité
-            title_ratio = self._levenshtein_ratio(query_title_clean, result_title_clean)
-            artist_ratio = self._levenshtein_ratio(query_artist_clean, result_artist_clean)
+    def _musicbrainz_release(self, release_id: str) -> Dict[str, Any]:
+        """Récupère une release MusicBrainz avec ses labels (mémoïsée par identifiant)."""
+        release = self._musicbrainz_releases.get(release_id)
+        if release is None:
+            self.rate_limiter.acquire('musicbrainz')
+            release = self.musicbrainz.get_release_by_id(release_id, includes=['labels']).get('release', {})
+            self._musicbrainz_releases.put(release_id, release)
+            provider_logger.debug("MusicBrainz - Détails de la release récupérés: %s", release_id)
+        return release
+
+    def _musicbrainz_artist_sort(self, artist: str) -> Optional[str]:
+        """Résout le nom de tri d'un artiste, via le cache d'artistes puis search_artists."""
+        if self.artist_cache:
+            cached = self.artist_cache.get(artist)
+            if cached is not None:
+                return cached[0]
+
+        self.rate_limiter.acquire('musicbrainz')
+        artist_result = self.musicbrainz.search_artists(artist, limit=1)
+        if not artist_result.get('artist-list'):
+            return None
 
-            logger.info(f"Ratios - Titre: {title_ratio}, Artiste: {artist_ratio}")
+        found = artist_result['artist-list'][0]
+        sort_name = found.get('sort-name', artist)
+        if self.artist_cache:
+            self.artist_cache.put(artist, sort_name, found.get('id'))
+        return sort_name
 
-            # Pondération : titre (60%) + artiste (40%)
-            confidence = (title_ratio * 0.6 + artist_ratio * 0.4) * 100
+    def _search_musicbrainz(self, title: str, artist: str) -> List[TrackMetadata]:
+        """Recherche sur MusicBrainz avec nettoyage des titres.
 
-            # Bonus si l'album correspond exactement
-            if query_title_clean in result_title_clean or result_title_clean in query_title_clean:
-                confidence = min(100, confidence + 20)
+        Une seule recherche d'enregistrements fournit les candidats et le nom de tri
+        de leurs artistes. Seul le meilleur candidat est retenu par _execute_search :
+        ses labels sont donc les seuls récupérés, avec une requête mémoïsée par release.
+        """
+        provider_logger.debug("MusicBrainz - Début de recherche pour titre='%s' artist='%s'", title, artist)
+        results = []
 
-            logger.info(f"Score de confiance final: {confidence}")
-            return confidence
+        try:
+            # Nettoyer le titre pour la recherche
+            clean_title = title.split('(')[0].strip()  # Enlever tout ce qui est entre parenthèses
+            clean_artist = (split_artists(artist) or (artist,))[0]  # Prendre seulement le premier artiste
 
-    def _levenshtein_ratio(self, s1: str, s2: str) -> float:
-        """Calcule le ratio de similarité entre deux chaînes."""
-        if not s1 or not s2:
-            return 0.0
+            provider_logger.debug("MusicBrainz - Recherche avec titre nettoyé: '%s' artiste: '%s'", clean_title, clean_artist)
 
-        distances = {}
-        len1, len2 = len(s1), len(s2)
+            self.rate_limiter.acquire('musicbrainz')
+            search_results = self.musicbrainz.search_recordings(
+                query=f'recording:"{clean_title}" AND artist:"{clean_artist}"',
+                limit=5
+            )
 
-        for i in range(len1 + 1):
-            distances[i] = {}
-            distances[i][0] = i
+            release_ids = {}
+            credited_artists = []
+            for recording in search_results.get('recording-list', []):
+                if not recording.get('release-list'):
+                    continue
 
-        for j in range(len2 + 1):
-            distances[0][j] = j
+                release = recording['release-list'][0]
+                credited_artist = recording['artist-credit'][0]['artist']
 
-        for i in range(1, len1 + 1):
-            for j in range(1, len2 + 1):
-                if s1[i-1] == s2[j-1]:
-                    distances[i][j] = distances[i-1][j-1]
-                else:
-                    distances[i][j] = min(distances[i-1][j],
-                                      distances[i][j-1],
-                                      distances[i-1][j-1]) + 1
+                metadata = TrackMetadata(
+                    title=recording['title'],
+                    artist=credited_artist['name'],
+                    album=release.get('title', ''),
+                    source="MusicBrainz",
+                    artist_sort=credited_artist.get('sort-name')  # Nom de tri fourni par le crédit
+                )
+                results.append(metadata)
+                release_ids[id(metadata)] = release['id']
+                credited_artists.append(
+                    (credited_artist['name'], credited_artist.get('sort-name'), credited_artist.get('id'))
+                )
 
-        max_length = max(len1, len2)
-        if max_length == 0:
-            return 1.0
+            # Les crédits alimentent le cache d'artistes : un artiste déjà vu ne coûte plus de requête
+            if self.artist_cache:
+                self.artist_cache.put_many(credited_artists)
+
+            # Calculer la confiance avec le titre original et trier les résultats, en un seul passage
+            results = rank_candidates(title, artist, results)
+
+            if results:
+                best = results[0]
+                release_id = release_ids[id(best)]
+                provider_logger.debug("MusicBrainz - ID de la release trouvé: %s", release_id)
+
+                # Extraire le label et le numéro de catalogue
+                actual_release = self._musicbrainz_release(release_id)
+                if actual_release.get('label-info-list'):
+                    label_info = actual_release['label-info-list'][0]
+                    if 'label' in label_info:
+                        best.label = label_info['label']['name']
+                        provider_logger.debug("MusicBrainz - Label trouvé: %s", best.label)
+                    if 'catalog-number' in label_info:
+                        best.catalog_number = label_info['catalog-number']
+                        provider_logger.debug("MusicBrainz - Numéro de catalogue trouvé: %s", best.catalog_number)
+
+                if not best.artist_sort:
+                    best.artist_sort = self._musicbrainz_artist_sort(clean_artist)
+                provider_logger.debug("MusicBrainz - Nom de tri trouvé: %s", best.artist_sort)
+                provider_logger.info("MusicBrainz - Meilleur résultat: %s", best)
+
+        except (KeyError, IndexError, TypeError) as e:
+            # Réponse inattendue : on garde les résultats déjà extraits.
+            # Les erreurs réseau sont propagées à _query_provider (pas de mise en cache)
+            logger.error(f"MusicBrainz - Erreur: {str(e)}")
 
-        return 1 - (distances[len1][len2] / max_length)
+        return results
 
 
 class MP3Processor:
@@ -545,6 +1035,11 @@ class MP3Processor:
             self.error_records = []
             self.not_found_records = []
             self.processing_canceled = False
+            self.scan_cache: Optional[ScanCache] = None
+            self.total_files = 0
+            self.discovered_files = 0
+            # Rang de chaque album dans l'ordre du scan (vue de l'index local)
+            self.album_ranks: Dict[Tuple, int] = {}
             self.update_summary = {
                 'total_files': 0,
                 'updated_files': 0,
@@ -557,71 +1052,288 @@ class MP3Processor:
                 'genres_found': set()  # Correction de genre_found -> genres_found
             }
 
+    def _performance_setting(self, key: str) -> Any:
+        """Retourne un réglage de performance (configuration ou valeur par défaut)."""
+        return ConfigManager.performance_setting(self.api_manager.config, key)
+
     def _is_valid_mp3_file(self, file_path: Path) -> bool:
         """Vérifie si le fichier est un MP3 valide et non un fichier caché."""
         # Ignore les fichiers cachés Mac OS et système
         if file_path.name.startswith('._') or file_path.name.startswith('.'):
             return False
-        # Vérifie si le fichier est accessible et valide
-        try:
-            EasyID3(str(file_path))
-            return True
-        except Exception:
-            return False
+        # Sonde légère de l'en-tête, sans parser le contenu du tag
+        return probe_mp3(file_path)
+
+    def _load_snapshot(self, file_path: Path) -> Optional[TagSnapshot]:
+        """Lit les tags d'un fichier une seule fois ; None si le fichier est caché ou invalide."""
+        if self.scan_cache:
+            if file_path.name.startswith('._') or file_path.name.startswith('.'):
+                return None
+            try:
+                stat = file_path.stat()
+            except OSError:
+                return None
+            # Fichier inchangé depuis le dernier scan : ni sonde ni parse
+            cached = self.scan_cache.get(str(file_path), stat.st_size, stat.st_mtime_ns)
+            if cached:
+                return TagSnapshot(file_path, metadata=cached)
 
-    def _read_metadata_safe(self, file_path: Path) -> Optional[TrackMetadata]:
-        """Version sécurisée de read_metadata sans récursion."""
         if not self._is_valid_mp3_file(file_path):
             return None
+        # Parse complet uniquement pour les fichiers ayant passé la sonde
+        try:
+            snapshot = TagSnapshot.load(file_path)
+        except Exception:
+            return None
+
+        if self.scan_cache:
+            self.scan_cache.put(str(file_path), stat.st_size, stat.st_mtime_ns, snapshot.metadata)
+        return snapshot
 
+    def _open_scan_cache(self) -> None:
+        """Ouvre le cache de scan persistant s'il est activé."""
+        if not self._performance_setting('scan_cache'):
+            return
         try:
-            audio = EasyID3(str(file_path))
-            return TrackMetadata(
-                title=audio.get('title', [''])[0],
-                artist=audio.get('artist', [''])[0],
-                album=audio.get('album', [''])[0],
-                label=audio.get('composer', [''])[0],
-                catalog_number=audio.get('grouping', [''])[0],
-                genre=audio.get('genre', [''])[0]
-            )
+            self.scan_cache = ScanCache(self._performance_setting('scan_cache_file'))
         except Exception as e:
-            # Log direct sans récursion
-            error_record = {
-                'file': str(file_path),
-                'title': '',
-                'artist': '',
-                'album': '',
-                'error': self.locale_manager.get_text("processor.metadata.error.read", None, str(e))
-            }
-            self.error_records.append(error_record)
-            return None
+            logger.warning(f"Cache de scan indisponible, scan complet: {e}")
+            self.scan_cache = None
+
+    def _close_scan_cache(self) -> None:
+        if self.scan_cache:
+            try:
+                self.scan_cache.close()
+            except Exception as e:
+                logger.error(f"Erreur lors de la fermeture du cache de scan: {e}")
+            self.scan_cache = None
+
+    def _discover_files(self, directory: Path) -> Iterator[Path]:
+        """Parcourt l'arborescence dossier par dossier (les fichiers d'un dossier sont contigus)."""
+        for root, dirnames, filenames in os.walk(directory):
+            dirnames.sort()
+            root_path = Path(root)
+            for name in sorted(filenames):
+                if fnmatch.fnmatch(name, '*.mp3'):
+                    yield root_path / name
+
+    def _count_files(self, directory: Path, progress_callback=None) -> None:
+        """Compte les fichiers MP3 en arrière-plan pour estimer la progression."""
+        total = sum(1 for _ in self._discover_files(directory))
+        self.total_files = total
+        if progress_callback and total:
+            progress_callback(
+                None,
+                self.locale_manager.get_text("processor.progress.start", None, total)
+            )
 
-    def group_files_by_album(self, files: List[Path], progress_callback) -> Dict[Tuple[str, bool], List[Path]]:
-        """Version améliorée du groupement de fichiers."""
+    def _scan_files(self, paths: Iterable[Path], progress_callback=None) -> Iterator[Tuple[Path, Optional[TagSnapshot]]]:
+        """Lit les tags des fichiers en parallèle en conservant l'ordre de découverte."""
+        workers = self._performance_setting('scan_workers')
+        start_time = time.perf_counter()
+        waiting_time = 0.0
+        scanned = 0
+
+        for path, snapshot in ordered_map(lambda p: (p, self._load_snapshot(p)), paths, workers,
+                                          should_stop=lambda: self.processing_canceled,
+                                          thread_name_prefix='amtu-scan'):
+            scanned += 1
+            # Le temps passé chez le consommateur (file pleine) ne compte pas dans le débit
+            yielded_at = time.perf_counter()
+            yield path, snapshot
+            waiting_time += time.perf_counter() - yielded_at
+
+        elapsed = time.perf_counter() - start_time - waiting_time
+        rate = scanned / elapsed if elapsed > 0 else float(scanned)
+        logger.info(f"Scan terminé : {scanned} fichiers lus en {elapsed:.2f}s ({rate:.0f} fichiers/s, {workers} threads)")
         if progress_callback:
-            progress_callback(None, self.locale_manager.get_text("processor.analysis.file_grouping"))
+            progress_callback(None, self.locale_manager.get_text(
+                "processor.analysis.scan_done",
+                None,
+                scanned,
+                elapsed,
+                rate
+            ))
+            if self.scan_cache:
+                progress_callback(None, self.locale_manager.get_text(
+                    "processor.analysis.scan_cache",
+                    None,
+                    self.scan_cache.hits,
+                    self.scan_cache.misses
+                ))
+
+    def _index_albums(self, files: List[TagSnapshot]) -> Dict[Tuple[str, str, str, bool], List[TagSnapshot]]:
+        """Indexe les fichiers par (album, artiste de l'album, dossier parent) et classe EP/album."""
+        album_index: Dict[Tuple[str, str, str], List[TagSnapshot]] = {}
+        for snapshot in files:
+            metadata = snapshot.metadata
+            if metadata.album:
+                album_key = (metadata.album, metadata.album_artist or '', str(snapshot.path.parent))
+                album_index.setdefault(album_key, []).append(snapshot)
 
         grouped = {}
-        # Filtrer d'abord les fichiers valides
-        valid_files = [f for f in files if self._is_valid_mp3_file(f)]
+        for (album_name, album_artist, directory), album_files in album_index.items():
+            is_ep = len(album_files) < 7
+            grouped[(album_name, album_artist, directory, is_ep)] = album_files
+        return grouped
 
-        for file_path in valid_files:
-            metadata = self._read_metadata_safe(file_path)
-            if metadata and metadata.album:
-                # Utiliser _read_metadata_safe pour éviter la récursion
-                album_files = [f for f in valid_files
-                             if (meta := self._read_metadata_safe(f))
-                             and meta.album == metadata.album]
+    def _produce_albums(self, directory: Path, album_queue: Queue, progress_callback,
+                        should_stop: Callable[[], bool]) -> None:
+        """Étages découverte → lecture des tags → assemblage des albums.
 
-                is_ep = len(album_files) < 7
-                album_info = (metadata.album, is_ep)
+        Un album est clé sur son dossier parent : il est complet dès que le parcours
+        passe au dossier suivant, et part aussitôt vers l'étage de recherche.
+        """
+        current_directory = None
+        current_files: List[TagSnapshot] = []
+        album_rank = 0
+        # Regroupement mesuré dossier par dossier, rapporté une fois le parcours terminé
+        grouping = {'albums': 0, 'files': 0, 'elapsed': 0.0}
 
-                if album_info not in grouped:
-                    grouped[album_info] = []
-                if file_path not in grouped[album_info]:
-                    grouped[album_info].append(file_path)
+        if progress_callback:
+            progress_callback(None, self.locale_manager.get_text("processor.analysis.file_grouping"))
 
-        return grouped
+        def emit_albums() -> bool:
+            nonlocal album_rank
+            # Les noms de tri des tags préchauffent le cache d'artistes avant les recherches
+            self.api_manager.warm_artist_cache(snapshot.metadata for snapshot in current_files)
+            start_time = time.perf_counter()
+            albums = self._index_albums(current_files)
+            grouping['elapsed'] += time.perf_counter() - start_time
+            grouping['albums'] += len(albums)
+            grouping['files'] += len(current_files)
+            for album_key, files in albums.items():
+                # Index local alimenté dans l'ordre du scan, avant la recherche de l'album
+                album_rank += 1
+                self.album_ranks[album_key] = album_rank
+                self.api_manager.index_library((snapshot.metadata for snapshot in files), album_rank)
+                if not queue_put(album_queue, (album_key, files), should_stop):
+                    return False
+            return True
+
+        for path, snapshot in self._scan_files(self._discover_files(directory), progress_callback):
+            if path.parent != current_directory:
+                if not emit_albums():
+                    return
+                current_directory, current_files = path.parent, []
+            if snapshot:
+                current_files.append(snapshot)
+                self.discovered_files += 1
+
+        if not emit_albums():
+            return
+
+        logger.info(f"Regroupement terminé : {grouping['albums']} albums pour {grouping['files']} fichiers "
+                    f"en {grouping['elapsed']:.2f}s")
+        if progress_callback:
+            progress_callback(None, self.locale_manager.get_text(
+                "processor.analysis.grouping_done",
+                None,
+                grouping['albums'],
+                grouping['files'],
+                grouping['elapsed']
+            ))
+
+    def _lookup_albums(self, album_queue: Queue, write_queue: Queue,
+                       should_stop: Callable[[], bool]) -> None:
+        """Étage de recherche : résout les métadonnées de chaque album reçu.
+
+        Les lookahead_albums albums suivants sont recherchés simultanément ; les
+        résultats partent vers l'étage d'écriture dans l'ordre de réception.
+        """
+        def lookup(item: Tuple[Tuple, List[TagSnapshot]]) -> Tuple:
+            album_key, files = item
+            return (album_key, files) + self._lookup_album(album_key, files)
+
+        lookahead = max(1, int(self._performance_setting('lookahead_albums')))
+        for result in ordered_map(lookup, queue_iter(album_queue, should_stop), lookahead,
+                                  max_in_flight=lookahead, should_stop=should_stop,
+                                  thread_name_prefix='amtu-lookahead'):
+            if not queue_put(write_queue, result, should_stop):
+                return
+
+    def _lookup_album(self, album_key: Tuple, files: List[TagSnapshot]
+                      ) -> Tuple[Optional[TrackMetadata], Optional[Exception], List[Tuple]]:
+        """Recherche les métadonnées d'un album en passant par la mémoire des albums introuvables.
+
+        Retourne (métadonnées, erreur, messages) ; les messages sont rejoués dans
+        l'ordre par l'étage d'écriture.
+        """
+        messages = [(None, self.locale_manager.get_text(
+            "processor.progress.processing_album",
+            None,
+            album_key[0]
+        ))]
+        first = files[0].metadata
+        not_found_cache = getattr(self.api_manager, 'not_found_cache', None)
+
+        if not_found_cache and not_found_cache.contains(first.album, first.artist):
+            messages.append((None, self.locale_manager.get_text("processor.deferred.known_not_found")))
+            return None, None, messages
+
+        metadata, error = None, None
+        try:
+            metadata = self._get_album_metadata(files[0], lambda value, message: messages.append((value, message)),
+                                                self.album_ranks.get(album_key))
+            if metadata is None and not_found_cache:
+                not_found_cache.add(first.album, first.artist)
+        except Exception as e:
+            error = e
+        return metadata, error, messages
+
+    def _retry_deferred(self, deferred: List[Tuple[Tuple, List[TagSnapshot]]],
+                        processed_count: int, progress_callback) -> int:
+        """Retente, dans la limite du budget de temps, les albums reportés après une erreur temporaire.
+
+        Tant qu'un fournisseur est suspendu par son disjoncteur, les nouvelles
+        tentatives échoueraient aussitôt : on attend d'abord la fin de sa pause (essai
+        de reprise), sans dépasser le budget.
+        """
+        budget = self._performance_setting('deferred_retry_budget')
+        deadline = time.monotonic() + budget
+        if progress_callback:
+            progress_callback(None, self.locale_manager.get_text(
+                "processor.deferred.start", None, len(deferred), budget
+            ))
+
+        index = 0
+        while index < len(deferred):
+            if self.processing_canceled:
+                break
+            remaining = deadline - time.monotonic()
+            pause = min(self.api_manager.breaker_wait(), remaining)
+            if pause > 0:
+                if progress_callback:
+                    progress_callback(None, self.locale_manager.get_text(
+                        "processor.deferred.waiting", None, pause
+                    ))
+                resume_at = time.monotonic() + pause
+                while not self.processing_canceled and time.monotonic() < resume_at:
+                    time.sleep(min(0.2, max(0.0, resume_at - time.monotonic())))
+                continue
+            if remaining <= 0:
+                if progress_callback:
+                    progress_callback(None, self.locale_manager.get_text(
+                        "processor.deferred.budget_exhausted", None, len(deferred) - index
+                    ))
+                for pending_key, pending_files in deferred[index:]:
+                    processed_count = self._write_album(
+                        pending_key[0], pending_files, None,
+                        TransientLookupError("budget de nouvelles tentatives épuisé"),
+                        processed_count, progress_callback
+                    )
+                break
+
+            album_key, files = deferred[index]
+            index += 1
+            metadata, error, messages = self._lookup_album(album_key, files)
+            if progress_callback:
+                for value, message in messages:
+                    progress_callback(value, message)
+            processed_count = self._write_album(album_key[0], files, metadata, error,
+                                                processed_count, progress_callback)
+
+        return processed_count
 
     def _get_album_metadata(self, file_path: Path, progress_callback) -> Optional[TrackMetadata]:
         """Obtient les métadonnées pour un album entier à partir d'un fichier."""
@@ -643,9 +1355,6 @@ class MP3Processor:
                 )
             )
 
-        # Délai pour éviter de surcharger les APIs
-        time.sleep(0.5)
-
         api_results = self.api_manager.search_track(current_metadata.title, current_metadata.artist)
 
         if not api_results:
@@ -687,10 +1396,11 @@ class MP3Processor:
 
         return None
 
-    def _log_error(self, file_path: Path, error_message: str) -> None:
+    def _log_error(self, file_path: Path, error_message: str,
+                   snapshot: Optional[TagSnapshot] = None) -> None:
         """Enregistre une erreur dans le fichier CSV."""
         try:
-            metadata = self._read_metadata(file_path)
+            metadata = snapshot.metadata if snapshot else self._read_metadata(file_path)
             error_record = {
                 'file': str(file_path),
                 'title': metadata.title if metadata else '',
@@ -715,17 +1425,14 @@ class MP3Processor:
             logger.error(f"Erreur lors de l'écriture du fichier d'erreurs: {e}")
 
     # Voici la version corrigée de la méthode _update_metadata
-    def _update_metadata(self, file_path: Path, metadata: TrackMetadata) -> None:
+    def _update_metadata(self, snapshot: TagSnapshot, metadata: TrackMetadata) -> None:
         """Met à jour uniquement le label et le numéro de catalogue dans les champs appropriés."""
+        file_path = snapshot.path
         try:
-            from mutagen.id3 import ID3, TCOM, GRP1, TPE1, TALB, TIT2, TCON, TDTG, TPE2, COMM
+            from mutagen.id3 import TCOM, GRP1, TPE1, TALB, TIT2, TCON, TDTG, TPE2, COMM
 
-            try:
-                audio = ID3(str(file_path))
-            except:
-                audio = ID3()
-                audio.save(str(file_path))
-                audio = ID3(str(file_path))
+            # Tags déjà parsés lors de la découverte : pas de nouvelle lecture
+            audio = snapshot.tags
 
             updated = False
 
@@ -744,7 +1451,7 @@ class MP3Processor:
                 if current_label.lower() != metadata.label.lower():
                     composer_frame = TCOM(encoding=3, text=[metadata.label])
                     audio['TCOM'] = composer_frame
-                    logger.info(f"Label mis à jour: '{current_label}' → '{metadata.label}'")
+                    writer_logger.info("Label mis à jour: '%s' → '%s'", current_label, metadata.label)
                     updated = True
                     self.update_summary['label_updates'] += 1
                     self.update_summary['labels_found'].add(metadata.label)
@@ -754,7 +1461,7 @@ class MP3Processor:
                 current_grouping = str(audio.get('GRP1', [''])[0]) if 'GRP1' in audio else ''
                 if current_grouping.lower() != metadata.catalog_number.lower():
                     audio['GRP1'] = GRP1(encoding=3, text=[metadata.catalog_number])
-                    logger.info(f"Numéro de catalogue mis à jour: '{current_grouping}' → '{metadata.catalog_number}'")
+                    writer_logger.info("Numéro de catalogue mis à jour: '%s' → '%s'", current_grouping, metadata.catalog_number)
                     updated = True
                     self.update_summary['catalog_updates'] += 1
                     self.update_summary['catalogs_found'].add(metadata.catalog_number)
@@ -769,12 +1476,12 @@ class MP3Processor:
                 if metadata.label and metadata.label.lower() in self.genre_manager.label_genre_rules:
                     new_genre = self.genre_manager.label_genre_rules[metadata.label.lower()]
                     should_update = True
-                    logger.info(f"Genre déterminé par le label: '{new_genre}' (label: {metadata.label})")
+                    writer_logger.info("Genre déterminé par le label: '%s' (label: %s)", new_genre, metadata.label)
 
                 elif metadata.artist and metadata.artist.lower() in self.genre_manager.artist_genre_rules:
                     new_genre = self.genre_manager.artist_genre_rules[metadata.artist.lower()]
                     should_update = True
-                    logger.info(f"Genre déterminé par l'artiste: '{new_genre}' (artiste: {metadata.artist})")
+                    writer_logger.info("Genre déterminé par l'artiste: '%s' (artiste: %s)", new_genre, metadata.artist)
 
                 elif current_genre:
                     current_genre_lower = current_genre.lower()
@@ -783,14 +1490,14 @@ class MP3Processor:
                         if mapped_genre != current_genre:
                             new_genre = mapped_genre
                             should_update = True
-                            logger.info(f"Genre remappé: '{current_genre}' → '{new_genre}'")
+                            writer_logger.info("Genre remappé: '%s' → '%s'", current_genre, new_genre)
 
                 elif not current_genre:
                     detected_genre = self.genre_manager.detect_genre(metadata)
                     if detected_genre:
                         new_genre = detected_genre
                         should_update = True
-                        logger.info(f"Nouveau genre détecté: '{new_genre}'")
+                        writer_logger.info("Nouveau genre détecté: '%s'", new_genre)
 
                 # Mise à jour du genre si nécessaire
                 if should_update and new_genre:
@@ -802,7 +1509,7 @@ class MP3Processor:
                     # Ajouter le nouveau genre
                     audio['TCON'] = TCON(encoding=3, text=[new_genre])
 
-                    logger.info(f"Genre mis à jour: '{current_genre}' → '{new_genre}'")
+                    writer_logger.info("Genre mis à jour: '%s' → '%s'", current_genre, new_genre)
                     self.update_summary['genre_updates'] += 1
                     self.update_summary['genres_found'].add(new_genre)
                     updated = True
@@ -829,7 +1536,7 @@ class MP3Processor:
 
             if new_album != current_album:
                 audio['TALB'] = TALB(encoding=3, text=[new_album])
-                logger.info(f"Album nettoyé: '{current_album}' → '{new_album}'")
+                writer_logger.info("Album nettoyé: '%s' → '%s'", current_album, new_album)
                 updated = True
                 existing_metadata['album'] = new_album
 
@@ -838,7 +1545,7 @@ class MP3Processor:
                 current_album_artist = str(audio.get('TPE2', [''])[0]) if 'TPE2' in audio else ''
                 if current_album_artist != metadata.artist:
                     audio['TPE2'] = TPE2(encoding=3, text=[metadata.artist])
-                    logger.info(f"Album Artist mis à jour: '{current_album_artist}' → '{metadata.artist}'")
+                    writer_logger.info("Album Artist mis à jour: '%s' → '%s'", current_album_artist, metadata.artist)
                     updated = True
 
             # Sauvegarder les modifications si nécessaire
@@ -846,29 +1553,26 @@ class MP3Processor:
                 original_time = os.path.getmtime(file_path)
                 self.update_summary['updated_files'] += 1
                 self.update_summary['source_used'] = metadata.source
-                audio.save(v2_version=4)
+                snapshot.save()
                 os.utime(file_path, (original_time, original_time))
-                logger.info(f"Fichier sauvegardé avec succès: {file_path.name}")
+                if self.scan_cache:
+                    # Les tags ont changé mais pas la date : mettre le cache à jour
+                    stat = file_path.stat()
+                    self.scan_cache.put(str(file_path), stat.st_size, stat.st_mtime_ns, snapshot.metadata)
+                writer_logger.info("Fichier sauvegardé avec succès: %s", file_path.name)
 
             self.update_summary['total_files'] += 1
 
         except Exception as e:
             error_msg = f"Erreur de mise à jour des tags: {str(e)}"
             logger.error(error_msg)
-            self._log_error(file_path, error_msg)
+            self._log_error(file_path, error_msg, snapshot)
             raise
 
     def _read_metadata(self, file_path: Path) -> Optional[TrackMetadata]:
         """Lit les métadonnées existantes d'un fichier MP3."""
         try:
-            audio = EasyID3(str(file_path))
-            return TrackMetadata(
-                title=audio.get('title', [''])[0],
-                artist=audio.get('artist', [''])[0],
-                album=audio.get('album', [''])[0],
-                label=audio.get('composer', [''])[0],
-                catalog_number=audio.get('grouping', [''])[0]
-            )
+            return TagSnapshot.load(file_path).metadata
         except Exception as e:
             error_msg = f"Erreur de lecture des tags: {str(e)}"
             self._log_error(file_path, error_msg)
@@ -904,11 +1608,12 @@ class MP3Processor:
         """Annule le traitement en cours."""
         self.processing_canceled = True
 
-    def _get_album_metadata(self, file_path: Path, progress_callback) -> Optional[TrackMetadata]:
-        """Obtient les métadonnées pour un album entier à partir d'un fichier."""
-        current_metadata = self._read_metadata(file_path)
+    def _get_album_metadata(self, snapshot: TagSnapshot, progress_callback,
+                            album_rank: Optional[int] = None) -> Optional[TrackMetadata]:
+        """Obtient les métadonnées pour un album entier à partir des tags déjà lus d'un fichier."""
+        current_metadata = snapshot.metadata
 
-        if not current_metadata or not (current_metadata.title and current_metadata.artist):
+        if not (current_metadata.title and current_metadata.artist):
             if progress_callback:
                 progress_callback(None, "    └─ ⚠️ Métadonnées manquantes ou incomplètes")
             return None
@@ -919,12 +1624,10 @@ class MP3Processor:
                 f"    └─ Recherche pour '{current_metadata.title}' - {current_metadata.artist}..."
             )
 
-        # Délai pour éviter de surcharger les APIs
-        time.sleep(0.5)
-
         api_results = self.api_manager.search_track(
             current_metadata.title,
-            current_metadata.artist
+            current_metadata.artist,
+            album_rank=album_rank
         )
 
         if not api_results:
@@ -949,20 +1652,64 @@ class MP3Processor:
             )
 
         # Modification de la condition pour accepter les résultats avec au moins un label
-        should_use_result = (best_match.confidence >= 60 and best_match.label)
+        should_use_result = (best_match.confidence >= APIManager.MIN_CONFIDENCE and best_match.label)
 
         # Log détaillé pour le débogage
-        logger.info(f"Évaluation du résultat - Score: {best_match.confidence}, "
-                   f"Label: {best_match.label}, "
-                   f"Catalogue: {best_match.catalog_number}")
+        logger.info("Évaluation du résultat - Score: %s, Label: %s, Catalogue: %s",
+                    best_match.confidence, best_match.label, best_match.catalog_number)
 
         if should_use_result:
             logger.info("Résultat accepté - Label trouvé avec score suffisant")
             return best_match
         else:
-            logger.info(f"Résultat ignoré - Score insuffisant ou pas de label")
+            logger.info("Résultat ignoré - Score insuffisant ou pas de label")
             return None
 
+    def _write_album(self, album_name: str, files: List[TagSnapshot], metadata: Optional[TrackMetadata],
+                     error: Optional[Exception], processed_count: int, progress_callback) -> int:
+        """Étage d'écriture : applique le résultat de la recherche aux fichiers d'un album."""
+        total_files = self.total_files or self.discovered_files
+        first_file = files[0]
+        try:
+            if error:
+                raise error
+
+            # Vérifie seulement si metadata existe et a un label
+            if metadata and metadata.label:
+                writer_logger.info("Traitement des fichiers pour %s avec le label %s", album_name, metadata.label)
+                for snapshot in files:
+                    file = snapshot.path
+                    try:
+                        self._update_metadata(snapshot, metadata)
+                        processed_count += 1
+                        if progress_callback:
+                            progress_callback(
+                                min(100.0, (processed_count / max(total_files, 1)) * 100),
+                                f"[{processed_count}/{total_files}] Mise à jour de {file.name}"
+                            )
+                    except Exception as e:
+                        error_msg = f"Erreur lors de la mise à jour du fichier {file.name}: {str(e)}"
+                        self._log_error(file, error_msg, snapshot)
+                        if progress_callback:
+                            progress_callback(None, f"❌ {error_msg}")
+            else:
+                reason = "Pas de label trouvé" if metadata else "Aucun résultat trouvé"
+                logger.info(f"Fichiers ignorés pour {album_name}: {reason}")
+                for snapshot in files:
+                    self._log_not_found(snapshot.path, snapshot.metadata, reason)
+
+        except Exception as e:
+            error_msg = f"Erreur lors du traitement de l'album {album_name}: {str(e)}"
+            self._log_error(first_file.path, error_msg, first_file)
+            if progress_callback:
+                progress_callback(None, f"❌ {error_msg}")
+        finally:
+            # L'album est traité : libérer les tags parsés
+            for snapshot in files:
+                snapshot.release()
+
+        return processed_count
+
     def process_directory(self, directory: Path, progress_callback=None) -> None:
         """Traite tous les fichiers MP3 dans un dossier et ses sous-dossiers."""
         try:
@@ -976,73 +1723,69 @@ class MP3Processor:
                     progress_callback(None, f"⚠️ Erreur lors du chargement des genres : {str(e)}")
                 logger.warning(f"Erreur lors du chargement des mappings de genre : {str(e)}")
 
-            # Filtrer les fichiers MP3 valides dès le début
-            mp3_files = [f for f in directory.rglob("*.mp3")
-                        if self._is_valid_mp3_file(f)]
-
-            total_files = len(mp3_files)
-            if total_files == 0:
-                if progress_callback:
-                    progress_callback(None, self.locale_manager.get_text("folder.status.no_mp3"))
-                return
-
-            if progress_callback:
-                progress_callback(
-                    0,
-                    self.locale_manager.get_text("processor.progress.start", None, total_files)
-                )
-
             self.error_records = []
             self.not_found_records = []
-            grouped_files = self.group_files_by_album(mp3_files, progress_callback)
+            self.total_files = 0
+            self.discovered_files = 0
+            self.album_ranks = {}
+            self._open_scan_cache()
+
+            # Pipeline : découverte → lecture des tags → albums → recherche → écriture,
+            # reliés par des files bornées pour que les étages se recouvrent
+            stop_event = threading.Event()
+            should_stop = lambda: self.processing_canceled or stop_event.is_set()
+            queue_size = self._performance_setting('pipeline_queue_size')
+            album_queue = Queue(maxsize=queue_size)
+            write_queue = Queue(maxsize=queue_size)
+
+            threading.Thread(target=self._count_files, args=(directory, progress_callback),
+                             name='amtu-count', daemon=True).start()
+            stages = [
+                StageThread(self._produce_albums, (directory, album_queue, progress_callback, should_stop),
+                            album_queue, should_stop, name='amtu-scan'),
+                StageThread(self._lookup_albums, (album_queue, write_queue, should_stop),
+                            write_queue, should_stop, name='amtu-lookup'),
+            ]
+            for stage in stages:
+                stage.start()
 
             processed_count = 0
-            for (album_name, is_ep), files in grouped_files.items():
-                if self.processing_canceled:
+            # Albums en échec temporaire, retentés en fin de traitement
+            deferred = []
+            try:
+                for album_key, files, metadata, error, messages in queue_iter(write_queue, should_stop):
                     if progress_callback:
-                        progress_callback(None, self.locale_manager.get_text("processor.progress.canceled"))
-                    break
+                        for value, message in messages:
+                            progress_callback(value, message)
+                    if isinstance(error, TransientLookupError):
+                        if progress_callback:
+                            progress_callback(None, self.locale_manager.get_text("processor.deferred.queued"))
+                        for snapshot in files:
+                            snapshot.release()
+                        deferred.append((album_key, files))
+                        continue
+                    processed_count = self._write_album(album_key[0], files, metadata, error,
+                                                        processed_count, progress_callback)
+            finally:
+                # Arrête les étages amont (fin normale, annulation ou erreur d'écriture)
+                stop_event.set()
+                for stage in stages:
+                    stage.join()
 
-                if progress_callback:
-                    progress_callback(None, self.locale_manager.get_text(
-                        "processor.progress.processing_album",
-                        None,
-                        album_name
-                    ))
+            for stage in stages:
+                if stage.error:
+                    raise stage.error
 
-                first_file = files[0]
-                try:
-                    metadata = self._get_album_metadata(first_file, progress_callback)
-
-                    # Vérifie seulement si metadata existe et a un label
-                    if metadata and metadata.label:
-                        logger.info(f"Traitement des fichiers pour {album_name} avec le label {metadata.label}")
-                        for file in files:
-                            try:
-                                self._update_metadata(file, metadata)
-                                processed_count += 1
-                                if progress_callback:
-                                    progress_callback(
-                                        (processed_count / total_files) * 100,
-                                        f"[{processed_count}/{total_files}] Mise à jour de {file.name}"
-                                    )
-                            except Exception as e:
-                                error_msg = f"Erreur lors de la mise à jour du fichier {file.name}: {str(e)}"
-                                self._log_error(file, error_msg)
-                                if progress_callback:
-                                    progress_callback(None, f"❌ {error_msg}")
-                    else:
-                        reason = "Pas de label trouvé" if metadata else "Aucun résultat trouvé"
-                        logger.info(f"Fichiers ignorés pour {album_name}: {reason}")
-                        for file in files:
-                            current_metadata = self._read_metadata(file)
-                            self._log_not_found(file, current_metadata, reason)
-
-                except Exception as e:
-                    error_msg = f"Erreur lors du traitement de l'album {album_name}: {str(e)}"
-                    self._log_error(first_file, error_msg)
-                    if progress_callback:
-                        progress_callback(None, f"❌ {error_msg}")
+            if deferred and not self.processing_canceled:
+                processed_count = self._retry_deferred(deferred, processed_count, progress_callback)
+
+            if self.processing_canceled:
+                if progress_callback:
+                    progress_callback(None, self.locale_manager.get_text("processor.progress.canceled"))
+            elif self.discovered_files == 0:
+                if progress_callback:
+                    progress_callback(None, self.locale_manager.get_text("folder.status.no_mp3"))
+                return
 
             if not self.processing_canceled and progress_callback:
                 progress_callback(100, "✅ Traitement terminé!")
@@ -1059,6 +1802,9 @@ class MP3Processor:
             if progress_callback:
                 progress_callback(None, f"❌ Erreur critique: {str(e)}")
             raise
+        finally:
+            self._close_scan_cache()
+            self.api_manager.flush_provider_stats()
 
     def get_update_summary(self) -> str:
             """Génère un résumé détaillé des mises à jour effectuées."""
@@ -1083,6 +1829,24 @@ class MP3Processor:
                     for genre in self.update_summary['genres_found']:
                         summary.append(f"    - {genre}")
 
+            lookup_cache = getattr(self.api_manager, 'lookup_cache', None)
+            if lookup_cache:
+                summary.append(f"  • Cache de recherche: {lookup_cache.hits} trouvés, {lookup_cache.misses} manqués")
+
+            for breaker in getattr(self.api_manager, 'breakers', {}).values():
+                if breaker.trips:
+                    state = "suspendu" if breaker.state == OPEN else "disponible"
+                    summary.append(f"  • {breaker.name}: {state} "
+                                   f"({breaker.trips} suspension(s) après échecs consécutifs)")
+
+            provider_stats = getattr(self.api_manager, 'provider_stats', None)
+            if provider_stats:
+                for service_name, _, display_name in APIManager.PROVIDERS:
+                    stat = provider_stats.get(service_name)
+                    if stat.samples:
+                        summary.append(f"  • {display_name}: {stat.success_rate:.0%} succès, "
+                                       f"{stat.label_rate:.0%} labels, {stat.latency:.2f}s")
+
             return "\n".join(summary)
 
 class MetadataManagerGUI:
@@ -1393,7 +2157,10 @@ class MetadataManagerGUI:
                     'musicbrainz': self.musicbrainz_enabled.get(),
                     'spotify': self.spotify_enabled.get(),
                     'discogs': self.discogs_enabled.get()
-                }
+                },
+                # Conserver les réglages de performance chargés depuis la configuration
+                'performance': self.config_manager.config.get(
+                    'performance', dict(ConfigManager.DEFAULT_PERFORMANCE))
             }
 
             enabled_services = [name for name, enabled in config['services'].items() if enabled]
@@ -1414,7 +2181,7 @@ class MetadataManagerGUI:
                 if config['services']['musicbrainz']:
                     services_steps.append((self.locale_manager.get_text("api.initialization.connection.musicbrainz"), 33))
 
-                self.api_manager = APIManager(config, self.locale_manager)
+                self.api_manager = APIManager(config, self.locale_manager, self.log_from_thread)
 
                 if config['services']['spotify']:
                     services_steps.append((self.locale_manager.get_text("api.initialization.connection.spotify"), 66))
@@ -1429,7 +2196,7 @@ class MetadataManagerGUI:
                         self.progress['value'] = progress
 
                         if step == 0:  # Initialisation des APIs au premier pas
-                            self.api_manager = APIManager(config, self.locale_manager)
+                            self.api_manager = APIManager(config, self.locale_manager, self.log_from_thread)
 
                         self.root.after(500, lambda: init_step(step + 1))
                     else:
@@ -1581,6 +2348,10 @@ class MetadataManagerGUI:
             self.log_text.insert(tk.END, message + "\n")
             self.log_text.see(tk.END)
 
+    def log_from_thread(self, message: str):
+        """Ajoute un message au log depuis un thread de travail."""
+        self.event_queue.put(("log", message))
+
     def update_progress(self, value, message):
         """Met à jour la progression et le log."""
         self.event_queue.put(("progress", value, message))
@@ -0,0 +1,76 @@
+# circuit_breaker.py
+import threading
+import time
+from typing import Callable, Optional
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(Exception):
+    """Le fournisseur est suspendu par son disjoncteur : aucune requête n'a été émise."""
+
+
+class CircuitBreaker:
+    """Disjoncteur d'un fournisseur.
+
+    Fermé, il laisse passer les requêtes et compte les échecs consécutifs. Au-delà
+    de failure_threshold, il s'ouvre : les requêtes sont refusées pendant cooldown
+    secondes. Il passe ensuite en semi-ouvert et laisse passer une seule requête de
+    test : un succès le referme, un échec le rouvre pour une nouvelle pause.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 5, cooldown: float = 120.0,
+                 on_state_change: Optional[Callable[['CircuitBreaker', str, str], None]] = None):
+        self.name = name
+        self.failure_threshold = max(1, int(failure_threshold))
+        self.cooldown = cooldown
+        self.on_state_change = on_state_change
+        self.state = CLOSED
+        self.failures = 0
+        self.trips = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Indique si une requête peut être émise (réserve la requête de test en semi-ouvert)."""
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.cooldown:
+                    return False
+                self._set_state_locked(HALF_OPEN)
+            if self.state == HALF_OPEN:
+                if self._probe_in_flight:
+                    return False
+                self._probe_in_flight = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.failures = 0
+            self._probe_in_flight = False
+            if self.state != CLOSED:
+                self._set_state_locked(CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+            self._probe_in_flight = False
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.failures >= self.failure_threshold):
+                self._opened_at = time.monotonic()
+                self.trips += 1
+                self._set_state_locked(OPEN)
+
+    def retry_in(self) -> float:
+        """Secondes restantes avant la prochaine requête de test."""
+        with self._lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, self.cooldown - (time.monotonic() - self._opened_at))
+
+    def _set_state_locked(self, state: str) -> None:
+        previous, self.state = self.state, state
+        if self.on_state_change and previous != state:
+            self.on_state_change(self, previous, state)
@@ -0,0 +1,169 @@
+# concurrency.py
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from queue import Empty, Full, Queue
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+
+def ordered_map(func: Callable[[T], R], items: Iterable[T], workers: int,
+                max_in_flight: Optional[int] = None,
+                should_stop: Optional[Callable[[], bool]] = None,
+                thread_name_prefix: str = 'amtu') -> Iterator[R]:
+    """Applique func sur un pool de threads en conservant l'ordre d'entrée.
+
+    Le nombre de tâches en cours est borné par max_in_flight (4 par worker par
+    défaut) : les éléments sont consommés au fur et à mesure, sans charger toute
+    la source en mémoire. La source est lue par un thread dédié : un résultat prêt
+    est rendu aussitôt, même si l'élément suivant tarde à arriver. should_stop
+    permet d'interrompre le traitement.
+    """
+    workers = max(1, int(workers))
+    max_in_flight = max(workers, int(max_in_flight or workers * 4))
+    # Tâches soumises, dans l'ordre d'entrée, puis END_OF_STREAM
+    submitted: Queue = Queue()
+    slots = threading.Semaphore(max_in_flight)
+    closed = threading.Event()
+
+    def stopped() -> bool:
+        return closed.is_set() or bool(should_stop and should_stop())
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=thread_name_prefix) as executor:
+        def feed() -> None:
+            try:
+                for item in items:
+                    while not slots.acquire(timeout=0.1):
+                        if stopped():
+                            return
+                    if stopped():
+                        return
+                    submitted.put(executor.submit(func, item))
+            except BaseException as e:
+                # Erreur de la source : relancée chez le consommateur, à sa place dans l'ordre
+                failed = Future()
+                failed.set_exception(e)
+                submitted.put(failed)
+            finally:
+                submitted.put(END_OF_STREAM)
+
+        feeder = threading.Thread(target=feed, name=f'{thread_name_prefix}-feed', daemon=True)
+        feeder.start()
+        try:
+            for future in queue_iter(submitted, stopped):
+                while not wait([future], timeout=0.1).done:
+                    if stopped():
+                        future.cancel()
+                        return
+                slots.release()
+                yield future.result()
+        finally:
+            # Annule les tâches non démarrées (arrêt ou sortie anticipée du consommateur)
+            closed.set()
+            feeder.join()
+            while True:
+                try:
+                    future = submitted.get_nowait()
+                except Empty:
+                    break
+                if future is not END_OF_STREAM:
+                    future.cancel()
+
+
+# Marqueur de fin de flux entre deux étages d'un pipeline
+END_OF_STREAM = object()
+
+
+def queue_put(q: Queue, item, should_stop: Callable[[], bool], timeout: float = 0.1) -> bool:
+    """Dépose un élément dans une file bornée ; False si le traitement est interrompu."""
+    while not should_stop():
+        try:
+            q.put(item, timeout=timeout)
+            return True
+        except Full:
+            continue
+    return False
+
+
+def queue_iter(q: Queue, should_stop: Callable[[], bool], timeout: float = 0.1) -> Iterator:
+    """Itère sur une file jusqu'au marqueur de fin ou jusqu'à l'interruption."""
+    while not should_stop():
+        try:
+            item = q.get(timeout=timeout)
+        except Empty:
+            continue
+        if item is END_OF_STREAM:
+            return
+        yield item
+
+
+class StageThread(threading.Thread):
+    """Étage de pipeline exécuté dans un thread.
+
+    L'exception éventuelle est conservée dans error pour être relancée par le
+    thread principal, et le marqueur de fin est toujours envoyé à l'étage suivant.
+    """
+
+    def __init__(self, target: Callable, args: tuple, output: Queue,
+                 should_stop: Callable[[], bool], name: str):
+        super().__init__(name=name, daemon=True)
+        self._stage_target = target
+        self._stage_args = args
+        self.output = output
+        self.should_stop = should_stop
+        self.error: Optional[BaseException] = None
+
+    def run(self) -> None:
+        try:
+            self._stage_target(*self._stage_args)
+        except BaseException as e:
+            self.error = e
+        finally:
+            queue_put(self.output, END_OF_STREAM, self.should_stop)
+
+
+class SingleFlight:
+    """Regroupe les appels concurrents identiques : un seul s'exécute, tous reçoivent son résultat.
+
+    Le premier appelant pour une clé exécute la fonction ; ceux qui arrivent
+    pendant son exécution attendent et partagent le résultat (ou l'exception).
+    Rien n'est conservé une fois l'appel terminé : ce n'est pas un cache.
+    """
+
+    class _Call:
+        def __init__(self):
+            self.done = threading.Event()
+            self.result = None
+            self.error: Optional[BaseException] = None
+
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.coalesced = 0
+
+    def do(self, key, func: Callable[[], R]) -> R:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = self._Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
@@ -0,0 +1,128 @@
+# fuzzy_index.py
+import threading
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+
+from normalization import clean_text
+from similarity import levenshtein_ratio
+
+NGRAM_SIZE = 3
+
+
+def ngrams(text: str, size: int = NGRAM_SIZE) -> Set[str]:
+    """N-grammes de caractères d'un texte normalisé (avec bornes de début et de fin)."""
+    padded = f" {text} "
+    if len(padded) <= size:
+        return {padded}
+    return {padded[i:i + size] for i in range(len(padded) - size + 1)}
+
+
+class FuzzyIndex:
+    """Index approximatif de noms connus (artistes, labels) par n-grammes de caractères.
+
+    Chaque nom est indexé sous sa forme normalisée ; les graphies d'origine sont
+    comptées pour retenir la plus fréquente comme forme canonique. Une recherche
+    ne compare que les noms partageant des n-grammes avec la requête, puis vérifie
+    la similarité avec la distance d'édition.
+
+    Chaque ajout porte un numéro de séquence (le rang de l'album dans l'ordre du
+    scan) ; une consultation avec before ne voit que les ajouts de rang inférieur,
+    ce qui rend le résultat indépendant de l'avancement des autres threads.
+    """
+
+    # Nombre maximal de noms vérifiés par la distance d'édition pour une recherche
+    MAX_CANDIDATES = 20
+    # Seuils, plus stricts que min_similarity, pour remplacer un nom inconnu par un nom connu
+    CANONICAL_SIMILARITY = 0.9
+    CANONICAL_MIN_WEIGHT = 3
+
+    def __init__(self, min_similarity: float = 0.85):
+        self.min_similarity = min_similarity
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        # Forme normalisée -> occurrences [séquence, graphie, poids], par séquence croissante
+        self._occurrences: Dict[str, List[list]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._occurrences)
+
+    def add(self, name: Optional[str], weight: int = 1, sequence: int = 0) -> None:
+        """Ajoute une occurrence d'un nom (une piste de la bibliothèque) au rang sequence."""
+        if not name:
+            return
+        key = clean_text(name)
+        if not key:
+            return
+        spelling = name.strip()
+        with self._lock:
+            occurrences = self._occurrences.get(key)
+            if occurrences is None:
+                occurrences = self._occurrences[key] = []
+                for gram in ngrams(key):
+                    self._postings[gram].add(key)
+            last = occurrences[-1] if occurrences else None
+            if last and last[0] == sequence and last[1] == spelling:
+                last[2] += weight
+            else:
+                occurrences.append([sequence, spelling, weight])
+
+    def _spellings_locked(self, key: str, before: Optional[int]) -> Counter:
+        """Graphies d'une forme normalisée ajoutées avant le rang before (toutes si None)."""
+        spellings = Counter()
+        for sequence, spelling, weight in self._occurrences.get(key, ()):
+            if before is not None and sequence >= before:
+                break
+            spellings[spelling] += weight
+        return spellings
+
+    def _visible_locked(self, key: str, before: Optional[int]) -> bool:
+        occurrences = self._occurrences.get(key)
+        return bool(occurrences) and (before is None or occurrences[0][0] < before)
+
+    def contains(self, name: Optional[str], before: Optional[int] = None) -> bool:
+        """Indique si le nom (à la normalisation près) est connu avant le rang before."""
+        if not name:
+            return False
+        key = clean_text(name)
+        with self._lock:
+            return self._visible_locked(key, before)
+
+    def _neighbours_locked(self, key: str, before: Optional[int]) -> List[Tuple[str, float]]:
+        """Noms visibles assez similaires à la forme normalisée key, avec leur similarité."""
+        shared = Counter()
+        for gram in ngrams(key):
+            shared.update(self._postings.get(gram, ()))
+        # Ordre total (n-grammes communs, puis nom) : le choix des candidats ne dépend
+        # pas de l'ordre d'itération des ensembles
+        ranked = sorted((item for item in shared.items() if self._visible_locked(item[0], before)),
+                        key=lambda item: (-item[1], item[0]))
+        neighbours = []
+        for candidate, _ in ranked[:self.MAX_CANDIDATES]:
+            score = levenshtein_ratio(key, candidate, score_cutoff=self.min_similarity)
+            if score:
+                neighbours.append((candidate, score))
+        return neighbours
+
+    def canonical(self, name: Optional[str], before: Optional[int] = None) -> Optional[str]:
+        """Graphie de référence d'un nom inconnu, s'il est à coup sûr une variante d'un nom connu.
+
+        Un nom déjà présent dans l'index (avant le rang before) n'est jamais
+        remplacé. Un nom inconnu ne l'est que s'il n'a qu'un seul voisin, très
+        similaire (CANONICAL_SIMILARITY) et assez fréquent (CANONICAL_MIN_WEIGHT).
+        Sinon, retourne None.
+        """
+        key = clean_text(name or '')
+        if not key:
+            return None
+        with self._lock:
+            if self._visible_locked(key, before):
+                return None
+            neighbours = self._neighbours_locked(key, before)
+            if len(neighbours) != 1:
+                return None
+            candidate, score = neighbours[0]
+            spellings = self._spellings_locked(candidate, before)
+            if score < self.CANONICAL_SIMILARITY or sum(spellings.values()) < self.CANONICAL_MIN_WEIGHT:
+                return None
+            # À fréquence égale, la graphie la plus ancienne dans l'ordre du scan
+            return spellings.most_common(1)[0][0]
@@ -0,0 +1,73 @@
+# logging_setup.py
+import atexit
+import copy
+import logging
+from logging.handlers import QueueHandler, QueueListener
+from queue import Queue
+from typing import Dict, Optional
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Sous-systèmes réglables séparément : clé de configuration -> suffixe du logger
+SUBSYSTEMS = {
+    'app': '',
+    'match': 'match',          # Détail du calcul de confiance de chaque candidat
+    'providers': 'providers',  # Requêtes et résultats des fournisseurs
+    'writer': 'writer',        # Écriture des tags
+}
+
+_listener: Optional[QueueListener] = None
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """Place les enregistrements dans la file sans les formater.
+
+    Seul le message est assemblé dans le thread appelant (les arguments peuvent
+    changer ensuite) ; la date, le format et l'écriture sont faits par le thread
+    du QueueListener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+def configure_logging(level: int = logging.INFO, fmt: str = LOG_FORMAT) -> None:
+    """Configure la journalisation : les écritures sont faites par un thread dédié.
+
+    Comme logging.basicConfig, ne fait rien si le logger racine a déjà des handlers.
+    """
+    global _listener
+    root = logging.getLogger()
+    if root.handlers:
+        return
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter(fmt))
+    log_queue: Queue = Queue(-1)
+    root.addHandler(_DeferredQueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = QueueListener(log_queue, handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def subsystem_logger(app_name: str, subsystem: str) -> logging.Logger:
+    suffix = SUBSYSTEMS[subsystem]
+    return logging.getLogger(f"{app_name}.{suffix}" if suffix else app_name)
+
+
+def apply_log_levels(levels: Dict[str, str], app_name: str) -> None:
+    """Applique les niveaux par sous-système ; une clé inconnue désigne un logger par son nom."""
+    for key, level in levels.items():
+        target = subsystem_logger(app_name, key) if key in SUBSYSTEMS else logging.getLogger(key)
+        try:
+            target.setLevel(str(level).upper())
+        except (TypeError, ValueError):
+            logging.getLogger(__name__).warning("Niveau de log invalide pour %s: %r", key, level)
@@ -0,0 +1,300 @@
+# lookup_cache.py
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from models import TrackMetadata
+
+logger = logging.getLogger(__name__)
+
+DAY = 24 * 3600
+
+
+def normalize_query(text: str) -> str:
+    """Normalise un titre ou un artiste pour servir de clé de cache."""
+    return re.sub(r'\s+', ' ', (text or '').casefold()).strip()
+
+
+class LookupCache:
+    """Cache persistant des résultats de recherche par fournisseur.
+
+    Les entrées sont indexées par (fournisseur, titre normalisé, artiste normalisé),
+    expirent selon un TTL propre à chaque fournisseur et sont évincées par ordre
+    de dernière utilisation (LRU) au-delà de max_entries. Une recherche sans
+    résultat est mémorisée comme entrée négative, avec son propre TTL.
+    """
+
+    def __init__(self, db_path: str = "lookup_cache.db", max_entries: int = 50000,
+                 ttl_days: Optional[Dict[str, float]] = None, negative_ttl_days: float = 3):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.ttl_days = ttl_days or {}
+        self.negative_ttl_days = negative_ttl_days
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            " provider TEXT NOT NULL,"
+            " query_key TEXT NOT NULL,"
+            " results TEXT NOT NULL,"
+            " negative INTEGER NOT NULL,"
+            " created REAL NOT NULL,"
+            " last_access REAL NOT NULL,"
+            " PRIMARY KEY (provider, query_key))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS results_lru ON results (last_access)")
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(title: str, artist: str) -> str:
+        return f"{normalize_query(title)}\x1f{normalize_query(artist)}"
+
+    def _ttl(self, provider: str, negative: bool) -> float:
+        days = self.negative_ttl_days if negative else self.ttl_days.get(provider, 30)
+        return days * DAY
+
+    def get(self, provider: str, title: str, artist: str) -> Optional[List[TrackMetadata]]:
+        """Retourne les résultats en cache ([] pour une entrée négative), None si absent ou expiré."""
+        key = self.make_key(title, artist)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT results, negative, created FROM results WHERE provider = ? AND query_key = ?",
+                (provider, key)
+            ).fetchone()
+            if row is None or now - row[2] > self._ttl(provider, bool(row[1])):
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute(
+                "UPDATE results SET last_access = ? WHERE provider = ? AND query_key = ?",
+                (now, provider, key)
+            )
+            self._conn.commit()
+
+        try:
+            return [TrackMetadata(**item) for item in json.loads(row[0])]
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Entrée de cache illisible ({provider}, {key!r}): {e}")
+            return None
+
+    def put(self, provider: str, title: str, artist: str, results: List[TrackMetadata]) -> None:
+        """Mémorise les résultats d'un fournisseur (liste vide = résultat négatif)."""
+        key = self.make_key(title, artist)
+        now = time.time()
+        payload = json.dumps([asdict(r) for r in results], ensure_ascii=False)
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO results (provider, query_key, results, negative, created, last_access)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (provider, key, payload, 0 if results else 1, now, now)
+                )
+                self._evict_locked()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Erreur lors de l'écriture du cache de recherche: {e}")
+
+    def _evict_locked(self) -> None:
+        """Évince les entrées les moins récemment utilisées au-delà de la taille maximale."""
+        count = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            # Évince un peu plus que nécessaire pour ne pas le refaire à chaque insertion
+            excess += self.max_entries // 10
+            self._conn.execute(
+                "DELETE FROM results WHERE rowid IN"
+                " (SELECT rowid FROM results ORDER BY last_access LIMIT ?)",
+                (excess,)
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class ArtistCache:
+    """Cache persistant de résolution des artistes : nom normalisé -> nom de tri et identifiant MusicBrainz.
+
+    Alimenté par les crédits d'artistes des recherches, par search_artists et par
+    les tags de la bibliothèque (TSOP, TXXX:MusicBrainz Artist Id). Les entrées
+    expirent après ttl_days et sont évincées par ordre LRU au-delà de max_entries.
+    """
+
+    def __init__(self, db_path: str = "lookup_cache.db", max_entries: int = 20000, ttl_days: float = 180):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self.ttl_days = ttl_days
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS artists ("
+            " name_key TEXT PRIMARY KEY,"
+            " sort_name TEXT NOT NULL,"
+            " artist_id TEXT,"
+            " created REAL NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS artists_lru ON artists (last_access)")
+        self._conn.commit()
+
+    def get(self, artist: str) -> Optional[Tuple[str, Optional[str]]]:
+        """Retourne (nom de tri, identifiant) de l'artiste, None si absent ou expiré."""
+        key = normalize_query(artist)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sort_name, artist_id, created FROM artists WHERE name_key = ?", (key,)
+            ).fetchone()
+            if row is None or now - row[2] > self.ttl_days * DAY:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._conn.execute("UPDATE artists SET last_access = ? WHERE name_key = ?", (now, key))
+            self._conn.commit()
+        return row[0], row[1]
+
+    def put_many(self, entries: Iterable[Tuple[str, str, Optional[str]]], replace: bool = True) -> int:
+        """Mémorise des artistes (nom, nom de tri, identifiant) ; retourne le nombre d'entrées écrites.
+
+        Avec replace=False, les entrées existantes sont conservées : c'est le mode
+        utilisé pour le préchauffage depuis les tags, moins fiables que MusicBrainz.
+        """
+        now = time.time()
+        rows = {}
+        for artist, sort_name, artist_id in entries:
+            key = normalize_query(artist)
+            if key and sort_name:
+                rows[key] = (key, sort_name, artist_id or None, now, now)
+        if not rows:
+            return 0
+
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        with self._lock:
+            try:
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    f"{verb} INTO artists (name_key, sort_name, artist_id, created, last_access)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    list(rows.values())
+                )
+                written = self._conn.total_changes - before
+                self._evict_locked()
+                self._conn.commit()
+                return written
+            except sqlite3.Error as e:
+                logger.error(f"Erreur lors de l'écriture du cache d'artistes: {e}")
+                return 0
+
+    def put(self, artist: str, sort_name: str, artist_id: Optional[str] = None) -> None:
+        self.put_many([(artist, sort_name, artist_id)])
+
+    def _evict_locked(self) -> None:
+        """Évince les artistes les moins récemment utilisés au-delà de la taille maximale."""
+        count = self._conn.execute("SELECT COUNT(*) FROM artists").fetchone()[0]
+        excess = count - self.max_entries
+        if excess > 0:
+            excess += self.max_entries // 10
+            self._conn.execute(
+                "DELETE FROM artists WHERE rowid IN"
+                " (SELECT rowid FROM artists ORDER BY last_access LIMIT ?)",
+                (excess,)
+            )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class LRUCache:
+    """Petit cache mémoire thread-safe, borné, avec éviction LRU."""
+
+    def __init__(self, max_size: int = 1024):
+        self.max_size = max(1, int(max_size))
+        self._items: "OrderedDict[str, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            if key not in self._items:
+                return default
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_size:
+                self._items.popitem(last=False)
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._items
+
+
+class NotFoundCache:
+    """Mémoire persistante des albums introuvables, pour ne pas les rechercher à chaque analyse.
+
+    Un album est identifié par son nom et son artiste normalisés ; l'entrée expire
+    après ttl_days afin que les albums finissent par être recherchés de nouveau.
+    """
+
+    def __init__(self, db_path: str = "lookup_cache.db", ttl_days: float = 30):
+        self.db_path = db_path
+        self.ttl_days = ttl_days
+        self.hits = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS not_found ("
+            " album_key TEXT PRIMARY KEY,"
+            " created REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def make_key(album: str, artist: str) -> str:
+        return f"{normalize_query(album)}\x1f{normalize_query(artist)}"
+
+    def contains(self, album: str, artist: str) -> bool:
+        """Indique si l'album a été introuvable récemment (entrées expirées supprimées)."""
+        key = self.make_key(album, artist)
+        with self._lock:
+            row = self._conn.execute("SELECT created FROM not_found WHERE album_key = ?", (key,)).fetchone()
+            if row is None:
+                return False
+            if time.time() - row[0] > self.ttl_days * DAY:
+                self._conn.execute("DELETE FROM not_found WHERE album_key = ?", (key,))
+                self._conn.commit()
+                return False
+            self.hits += 1
+            return True
+
+    def add(self, album: str, artist: str) -> None:
+        key = self.make_key(album, artist)
+        with self._lock:
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO not_found (album_key, created) VALUES (?, ?)", (key, time.time())
+                )
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.error(f"Erreur lors de l'écriture de la mémoire des albums introuvables: {e}")
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -16,3 +16,5 @@ class TrackMetadata:
     source: str = ""
     year: Optional[int] = None
     genre: Optional[str] = None
+    album_artist: Optional[str] = None
+    musicbrainz_artist_id: Optional[str] = None
@@ -0,0 +1,66 @@
+# normalization.py
+import re
+import unicodedata
+from functools import lru_cache
+from typing import NamedTuple, Tuple
+
+# Taille des caches de normalisation (les mêmes titres et artistes reviennent sans cesse)
+CACHE_SIZE = 8192
+
+_BRACKETS = re.compile(r'\([^()]*\)|\[[^\[\]]*\]|\{[^{}]*\}')
+# "feat. X", "ft X", "featuring X" : tout ce qui suit est un artiste invité
+_FEATURING = re.compile(r'\s(?:feat\.?|ft\.?|featuring)\s.*$', re.IGNORECASE)
+# Suffixe de version : "Titre - Extended Mix", "Titre - Radio Edit", "Titre - X Remix"
+_VERSION_SUFFIX = re.compile(
+    r'\s+[-–—]\s+[^-–—]*\b(?:remix|mix|edit|version|remaster(?:ed)?|dub|rework|live)\b[^-–—]*$',
+    re.IGNORECASE
+)
+_APOSTROPHES = re.compile(r"['’`´]")
+_NON_WORD = re.compile(r'[\W_]+')
+# Séparateurs d'artistes sans ambiguïté ("and", "," ou "+" font partie de noms de groupes)
+_ARTIST_SEPARATORS = re.compile(
+    r'\s*(?:&|;|\s/\s|\s(?:x|vs\.?|feat\.?|ft\.?|featuring)\s)\s*',
+    re.IGNORECASE
+)
+
+
+class QueryForms(NamedTuple):
+    """Formes normalisées d'une requête, calculées une seule fois par recherche."""
+    title: str
+    artist: str
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def fold(text: str) -> str:
+    """Minuscules Unicode (casefold) et suppression des accents."""
+    decomposed = unicodedata.normalize('NFKD', text.casefold())
+    return ''.join(c for c in decomposed if not unicodedata.combining(c))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def clean_text(text: str) -> str:
+    """Texte comparable : sans parenthèses, invités, suffixe de version, accents ni ponctuation."""
+    previous = None
+    while previous != text:  # Parenthèses imbriquées : de l'intérieur vers l'extérieur
+        previous, text = text, _BRACKETS.sub(' ', text)
+    text = _FEATURING.sub('', text)
+    text = _VERSION_SUFFIX.sub('', text)
+    text = _APOSTROPHES.sub('', fold(text))
+    return _NON_WORD.sub(' ', text).strip()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def split_artists(text: str) -> Tuple[str, ...]:
+    """Sépare une chaîne d'artistes ("A & B feat. C", "A, B", "A vs B"...)."""
+    return tuple(part for part in (p.strip() for p in _ARTIST_SEPARATORS.split(text)) if part)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def primary_artist(text: str) -> str:
+    """Forme comparable du premier artiste crédité."""
+    artists = split_artists(text)
+    return clean_text(artists[0]) if artists else ''
+
+
+def query_forms(title: str, artist: str) -> QueryForms:
+    return QueryForms(clean_text(title), primary_artist(artist))
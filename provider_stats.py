@@ -0,0 +1,114 @@
+# provider_stats.py
+import logging
+import sqlite3
+import threading
+from typing import Dict, List, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderStat:
+    """Statistiques glissantes (moyennes exponentielles) d'un fournisseur."""
+
+    def __init__(self, samples: int = 0, success_rate: float = 1.0,
+                 label_rate: float = 0.5, latency: float = 1.0):
+        self.samples = samples
+        self.success_rate = success_rate
+        self.label_rate = label_rate
+        self.latency = latency
+
+    @property
+    def expected_value(self) -> float:
+        """Probabilité d'obtenir un résultat avec label par seconde d'attente."""
+        return self.success_rate * self.label_rate / max(self.latency, 0.01)
+
+
+class ProviderStats:
+    """Statistiques persistantes par fournisseur : taux de succès, taux de label, latence.
+
+    Les moyennes sont exponentielles (poids alpha pour chaque nouvelle mesure) afin
+    de suivre l'évolution des fournisseurs. Elles servent à ordonner les fournisseurs
+    par valeur attendue, ce qui minimise le temps moyen avant un résultat exploitable.
+    """
+
+    # Nombre de mesures accumulées avant une écriture sur le disque
+    FLUSH_EVERY = 20
+
+    def __init__(self, db_path: str = "lookup_cache.db", alpha: float = 0.1):
+        self.db_path = db_path
+        self.alpha = alpha
+        self._lock = threading.Lock()
+        self._stats: Dict[str, ProviderStat] = {}
+        self._dirty = 0
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS provider_stats ("
+            " provider TEXT PRIMARY KEY,"
+            " samples INTEGER NOT NULL,"
+            " success_rate REAL NOT NULL,"
+            " label_rate REAL NOT NULL,"
+            " latency REAL NOT NULL)"
+        )
+        self._conn.commit()
+        for provider, samples, success_rate, label_rate, latency in self._conn.execute(
+                "SELECT provider, samples, success_rate, label_rate, latency FROM provider_stats"):
+            self._stats[provider] = ProviderStat(samples, success_rate, label_rate, latency)
+
+    def get(self, provider: str) -> ProviderStat:
+        with self._lock:
+            stat = self._stats.get(provider)
+            return ProviderStat(stat.samples, stat.success_rate, stat.label_rate, stat.latency) if stat else ProviderStat()
+
+    def record(self, provider: str, success: bool, label_hit: bool, latency: float) -> None:
+        """Enregistre le résultat d'un appel réel au fournisseur (hors cache)."""
+        with self._lock:
+            stat = self._stats.setdefault(provider, ProviderStat())
+            if stat.samples == 0:
+                # Première mesure : elle remplace les valeurs a priori
+                stat.success_rate, stat.latency = float(success), latency
+                stat.label_rate = float(label_hit)
+            else:
+                stat.success_rate += self.alpha * (float(success) - stat.success_rate)
+                stat.label_rate += self.alpha * (float(label_hit) - stat.label_rate)
+                if success:
+                    stat.latency += self.alpha * (latency - stat.latency)
+            stat.samples += 1
+            self._dirty += 1
+            if self._dirty >= self.FLUSH_EVERY:
+                self._flush_locked()
+
+    def rank(self, providers: Sequence[str], min_samples: int = 20) -> List[str]:
+        """Ordonne les fournisseurs par valeur attendue décroissante.
+
+        Tant qu'un fournisseur n'a pas assez de mesures, l'ordre reçu est conservé.
+        """
+        with self._lock:
+            stats = [self._stats.get(provider) for provider in providers]
+        if any(stat is None or stat.samples < min_samples for stat in stats):
+            return list(providers)
+        ranked = sorted(zip(providers, stats), key=lambda item: item[1].expected_value, reverse=True)
+        return [provider for provider, _ in ranked]
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+    def _flush_locked(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO provider_stats (provider, samples, success_rate, label_rate, latency)"
+                " VALUES (?, ?, ?, ?, ?)",
+                [(provider, s.samples, s.success_rate, s.label_rate, s.latency) for provider, s in self._stats.items()]
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Erreur lors de l'écriture des statistiques des fournisseurs: {e}")
+        self._dirty = 0
@@ -0,0 +1,62 @@
+# rate_limiter.py
+import logging
+import threading
+import time
+from typing import Dict, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """Seau à jetons thread-safe : au plus `rate` requêtes par seconde, rafales de `capacity`."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Réserve un jeton et retourne le temps d'attente avant de pouvoir l'utiliser."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Le solde peut devenir négatif : les appelants suivants attendent leur tour
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """Bloque jusqu'à ce qu'une requête soit autorisée ; retourne le temps attendu."""
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class RateLimiter:
+    """Limiteur de débit partagé, avec un seau à jetons par service."""
+
+    def __init__(self, limits: Dict[str, Sequence[float]]):
+        """limits : {service: (nombre de requêtes, période en secondes)}.
+
+        Les requêtes sont espacées régulièrement (seau d'un seul jeton) : un seau de
+        capacité N, plein au départ et rempli à N / période, laisserait passer
+        jusqu'à 2N requêtes sur une même période.
+        """
+        self._buckets: Dict[str, TokenBucket] = {}
+        for service, (requests, period) in limits.items():
+            self._buckets[service] = TokenBucket(rate=requests / period, capacity=1)
+
+    def acquire(self, service: str) -> float:
+        """Attend le droit d'émettre une requête vers le service (sans limite s'il est inconnu)."""
+        bucket = self._buckets.get(service)
+        if bucket is None:
+            return 0.0
+        waited = bucket.acquire()
+        if waited > 0:
+            logger.debug(f"{service} - Limitation de débit: attente de {waited:.2f}s")
+        return waited
@@ -0,0 +1,121 @@
+# retry_policy.py
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Callable, Optional, TypeVar
+
+T = TypeVar('T')
+
+# Statuts HTTP temporaires justifiant une nouvelle tentative
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+def http_status(error: BaseException) -> Optional[int]:
+    """Extrait le statut HTTP d'une erreur spotipy, discogs_client, musicbrainzngs ou requests."""
+    for attr in ('http_status', 'status_code'):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value
+    # musicbrainzngs encapsule l'erreur urllib dans cause, requests dans response
+    cause = getattr(error, 'cause', None)
+    if isinstance(getattr(cause, 'code', None), int):
+        return cause.code
+    response = getattr(error, 'response', None)
+    if isinstance(getattr(response, 'status_code', None), int):
+        return response.status_code
+    return None
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Retourne le délai demandé par l'en-tête Retry-After de la réponse, s'il existe."""
+    for source in (error, getattr(error, 'cause', None), getattr(error, 'response', None)):
+        headers = getattr(source, 'headers', None)
+        if not headers:
+            continue
+        value = headers.get('Retry-After')
+        if value is None:
+            continue
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Erreur temporaire : limitation de débit, erreur serveur ou problème réseau."""
+    status = http_status(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS
+    return isinstance(error, OSError) or isinstance(getattr(error, 'cause', None), OSError)
+
+
+class RetryPolicy:
+    """Nouvelles tentatives avec attente exponentielle et gigue.
+
+    Le délai suit base_delay * 2^n (plafonné à max_delay), tiré aléatoirement dans
+    sa seconde moitié pour désynchroniser les appelants. Un Retry-After fourni par
+    le serveur est respecté tel quel. Le temps total passé en attentes ne dépasse
+    jamais max_total : l'erreur est relancée plutôt que d'attendre au-delà.
+    """
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 1.0,
+                 max_delay: float = 30.0, max_total: float = 20.0):
+        self.max_attempts = max(1, int(max_attempts))
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_total = max_total
+
+    def backoff(self, attempt: int) -> float:
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(ceiling / 2, ceiling)
+
+    def run(self, func: Callable[[], T],
+            retry_hint: Optional[Callable[[BaseException], Optional[float]]] = None,
+            on_retry: Optional[Callable[[int, float, BaseException], None]] = None,
+            should_stop: Optional[Callable[[], bool]] = None) -> T:
+        """Exécute func, en réessayant les erreurs temporaires selon la politique.
+
+        should_stop permet d'abandonner les nouvelles tentatives (l'erreur est relancée).
+        """
+        waited = 0.0
+        attempt = 0
+        while True:
+            try:
+                return func()
+            except Exception as e:
+                attempt += 1
+                if attempt >= self.max_attempts or not is_retryable(e):
+                    raise
+                if should_stop and should_stop():
+                    raise
+
+                hint = retry_hint(e) if retry_hint else None
+                delay = hint if hint is not None else self.backoff(attempt)
+                if waited + delay > self.max_total:
+                    raise
+
+                if on_retry:
+                    on_retry(attempt, delay, e)
+                time.sleep(delay)
+                waited += delay
+
+
+class ProviderLookupError(Exception):
+    """Aucun résultat exploitable, mais au moins un fournisseur a échoué.
+
+    L'absence de résultat n'est pas concluante : l'album ne doit pas être
+    mémorisé comme introuvable.
+    """
+
+
+class TransientLookupError(ProviderLookupError):
+    """Aucun résultat exploitable, mais au moins un fournisseur a échoué temporairement.
+
+    La recherche mérite d'être retentée plus tard plutôt que d'être considérée
+    comme introuvable.
+    """
@@ -0,0 +1,84 @@
+# scan_cache.py
+import json
+import logging
+import sqlite3
+import threading
+from dataclasses import asdict
+from typing import List, Optional, Tuple
+
+from models import TrackMetadata
+
+logger = logging.getLogger(__name__)
+
+
+class ScanCache:
+    """Cache persistant des métadonnées lues, indexé par chemin, taille et date de modification."""
+
+    # Nombre d'écritures accumulées avant un commit
+    FLUSH_SIZE = 500
+
+    def __init__(self, db_path: str = "scan_cache.db"):
+        self.db_path = db_path
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, int, int, str]] = []
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            " path TEXT PRIMARY KEY,"
+            " size INTEGER NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " metadata TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, path: str, size: int, mtime_ns: int) -> Optional[TrackMetadata]:
+        """Retourne les métadonnées en cache si le fichier n'a pas changé."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT size, mtime_ns, metadata FROM files WHERE path = ?", (path,)
+            ).fetchone()
+            if row is None or row[0] != size or row[1] != mtime_ns:
+                self.misses += 1
+                return None
+            self.hits += 1
+
+        try:
+            return TrackMetadata(**json.loads(row[2]))
+        except (TypeError, ValueError) as e:
+            logger.debug(f"Entrée de cache illisible pour {path}: {e}")
+            return None
+
+    def put(self, path: str, size: int, mtime_ns: int, metadata: TrackMetadata) -> None:
+        """Enregistre les métadonnées d'un fichier (écritures regroupées par lots)."""
+        with self._lock:
+            self._pending.append((path, size, mtime_ns, json.dumps(asdict(metadata), ensure_ascii=False)))
+            if len(self._pending) >= self.FLUSH_SIZE:
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Écrit les entrées en attente sur le disque."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Écrit les entrées en attente et ferme la base."""
+        with self._lock:
+            self._flush_locked()
+            self._conn.close()
+
+    def _flush_locked(self) -> None:
+        if not self._pending:
+            return
+        try:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO files (path, size, mtime_ns, metadata) VALUES (?, ?, ?, ?)",
+                self._pending
+            )
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Erreur lors de l'écriture du cache de scan: {e}")
+        self._pending = []
@@ -0,0 +1,77 @@
+# scoring.py
+from typing import Callable, Iterable, List, Optional, Sequence
+
+from models import TrackMetadata
+from normalization import query_forms
+from similarity import levenshtein_ratio
+
+# Pondération du score : titre (60%) + artiste (40%), bonus si un titre contient l'autre
+TITLE_WEIGHT = 0.6
+ARTIST_WEIGHT = 0.4
+CONTAINS_BONUS = 20
+
+
+def confidence(title_ratio: float, artist_ratio: float, contains: bool) -> float:
+    """Score de confiance (0-100) à partir des ratios de similarité."""
+    score = (title_ratio * TITLE_WEIGHT + artist_ratio * ARTIST_WEIGHT) * 100
+    if contains:
+        score = min(100, score + CONTAINS_BONUS)
+    return score
+
+
+def score_candidates(query_title: str, query_artist: str,
+                     candidates: Sequence[TrackMetadata]) -> List[float]:
+    """Calcule en un seul passage le score de confiance de tous les candidats.
+
+    Les formes normalisées et les ratios sont calculés une fois par valeur
+    distincte (titres et artistes se répètent d'un fournisseur à l'autre).
+    """
+    if not candidates:
+        return []
+    if not (query_title and query_artist):
+        return [0.0] * len(candidates)
+
+    query = query_forms(query_title, query_artist)
+    title_memo, artist_memo = {}, {}
+    scores = []
+
+    for candidate in candidates:
+        if not (candidate.title and candidate.artist):
+            scores.append(0.0)
+            continue
+        result = query_forms(candidate.title, candidate.artist)
+        if result.title not in title_memo:
+            title_memo[result.title] = levenshtein_ratio(query.title, result.title)
+        if result.artist not in artist_memo:
+            artist_memo[result.artist] = levenshtein_ratio(query.artist, result.artist)
+        scores.append(confidence(
+            title_memo[result.title], artist_memo[result.artist],
+            query.title in result.title or result.title in query.title
+        ))
+    return scores
+
+
+def rank_candidates(query_title: str, query_artist: str, candidates: Sequence[TrackMetadata],
+                    prior: Optional[Callable[[TrackMetadata], float]] = None) -> List[TrackMetadata]:
+    """Renseigne la confiance des candidats et les retourne du meilleur au moins bon.
+
+    Le tri est stable : à confiance égale, l'ordre d'origine (fournisseur, rang
+    dans ses résultats) est conservé, comme avec max() sur chaque fournisseur.
+    prior départage les candidats de même confiance (par exemple un label déjà connu).
+    """
+    for candidate, score in zip(candidates, score_candidates(query_title, query_artist, candidates)):
+        candidate.confidence = score
+    return merge_ranked([candidates], prior)
+
+
+def merge_ranked(batches: Iterable[Sequence[TrackMetadata]],
+                 prior: Optional[Callable[[TrackMetadata], float]] = None) -> List[TrackMetadata]:
+    """Fusionne des lots déjà notés (confiance renseignée), sans recalculer les scores.
+
+    Tri stable : à confiance égale (et prior égal), l'ordre des lots puis celui
+    des candidats dans chaque lot est conservé.
+    """
+    merged = [candidate for batch in batches for candidate in batch]
+    if prior is None:
+        return sorted(merged, key=lambda candidate: candidate.confidence, reverse=True)
+    return sorted(merged, key=lambda candidate: (candidate.confidence, prior(candidate)), reverse=True)
@@ -0,0 +1,176 @@
+# similarity.py
+from typing import Dict, Optional
+
+try:  # Moteur compilé optionnel, résultats identiques
+    from rapidfuzz.distance import Levenshtein as _rapidfuzz_levenshtein
+except ImportError:
+    _rapidfuzz_levenshtein = None
+
+HAS_RAPIDFUZZ = _rapidfuzz_levenshtein is not None
+
+
+def _myers_distance(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """Distance de Levenshtein par l'algorithme bit-parallèle de Myers (variante de Hyyrö).
+
+    Une colonne entière de la matrice de programmation dynamique est codée dans
+    des entiers (un bit par caractère de la chaîne la plus courte) : chaque
+    caractère de l'autre chaîne coûte quelques opérations sur ces entiers.
+    """
+    if len(s1) > len(s2):
+        s1, s2 = s2, s1
+    m, n = len(s1), len(s2)
+    if m == 0:
+        return n
+
+    peq: Dict[str, int] = {}
+    for i, c in enumerate(s1):
+        peq[c] = peq.get(c, 0) | (1 << i)
+
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    pv, mv = mask, 0
+    score = m
+
+    for j, c in enumerate(s2):
+        eq = peq.get(c, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & mask)
+        mh = pv & xh
+        if ph & last:
+            score += 1
+        elif mh & last:
+            score -= 1
+        # Chaque caractère restant fait baisser la distance d'au plus 1
+        if max_distance is not None and score - (n - j - 1) > max_distance:
+            return max_distance + 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        pv = mh | (~(xv | ph) & mask)
+        mv = ph & xv
+
+    return score
+
+
+def _rolling_distance(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """Distance de Levenshtein par programmation dynamique sur deux lignes."""
+    if len(s1) < len(s2):
+        s1, s2 = s2, s1
+    previous = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, 1):
+        current = [i]
+        for j, c2 in enumerate(s2, 1):
+            if c1 == c2:
+                current.append(previous[j - 1])
+            else:
+                current.append(min(previous[j], current[j - 1], previous[j - 1]) + 1)
+        # Le minimum d'une ligne ne peut que croître sur les lignes suivantes
+        if max_distance is not None and min(current) > max_distance:
+            return max_distance + 1
+        previous = current
+    if max_distance is not None:
+        return min(previous[-1], max_distance + 1)
+    return previous[-1]
+
+
+def levenshtein_distance(s1: str, s2: str, max_distance: Optional[int] = None) -> int:
+    """Distance d'édition (insertion, suppression, substitution de coût 1).
+
+    Avec max_distance, le calcul s'arrête dès que la distance ne peut plus rester
+    dans la limite ; max_distance + 1 est alors retourné.
+    """
+    if _rapidfuzz_levenshtein is not None:
+        return _rapidfuzz_levenshtein.distance(s1, s2, score_cutoff=max_distance)
+    return _myers_distance(s1, s2, max_distance)
+
+
+def levenshtein_ratio(s1: str, s2: str, score_cutoff: Optional[float] = None) -> float:
+    """Ratio de similarité 1 - distance / longueur maximale (0.0 si une chaîne est vide).
+
+    Avec score_cutoff, un ratio inférieur au seuil est retourné comme 0.0 sans
+    calculer la distance exacte.
+    """
+    if not s1 or not s2:
+        return 0.0
+
+    max_length = max(len(s1), len(s2))
+    max_distance = None
+    if score_cutoff is not None:
+        if score_cutoff > 1.0:
+            return 0.0
+        max_distance = int((1.0 - score_cutoff) * max_length + 1e-9)
+
+    ratio = 1 - (levenshtein_distance(s1, s2, max_distance) / max_length)
+    if score_cutoff is not None and ratio < score_cutoff:
+        return 0.0
+    return ratio
+
+
+def _reference_ratio(s1: str, s2: str) -> float:
+    """Implémentation historique (table complète en dictionnaires), pour la comparaison."""
+    if not s1 or not s2:
+        return 0.0
+    len1, len2 = len(s1), len(s2)
+    distances = {i: {0: i} for i in range(len1 + 1)}
+    for j in range(len2 + 1):
+        distances[0][j] = j
+    for i in range(1, len1 + 1):
+        for j in range(1, len2 + 1):
+            if s1[i - 1] == s2[j - 1]:
+                distances[i][j] = distances[i - 1][j - 1]
+            else:
+                distances[i][j] = min(distances[i - 1][j], distances[i][j - 1], distances[i - 1][j - 1]) + 1
+    return 1 - (distances[len1][len2] / max(len1, len2))
+
+
+if __name__ == '__main__':
+    # Micro-benchmark : python similarity.py
+    import random
+    import string
+    import timeit
+
+    random.seed(42)
+    alphabet = string.ascii_lowercase + ' '
+
+    def mutate(text: str) -> str:
+        chars = list(text)
+        for _ in range(random.randint(0, 4)):
+            position = random.randrange(len(chars) + 1)
+            operation = random.choice('ids')
+            if operation == 'i':
+                chars.insert(position, random.choice(alphabet))
+            elif chars and position < len(chars):
+                if operation == 'd':
+                    del chars[position]
+                else:
+                    chars[position] = random.choice(alphabet)
+        return ''.join(chars)
+
+    pairs = []
+    for _ in range(500):
+        text = ''.join(random.choice(alphabet) for _ in range(random.randint(1, 40)))
+        pairs.append((text, mutate(text) or 'x'))
+
+    engines = [
+        ("référence (dict)", _reference_ratio),
+        ("lignes glissantes", lambda a, b: 1 - _rolling_distance(a, b) / max(len(a), len(b))),
+        ("Myers bit-parallèle", lambda a, b: 1 - _myers_distance(a, b) / max(len(a), len(b))),
+    ]
+    if HAS_RAPIDFUZZ:
+        engines.append(("rapidfuzz", lambda a, b: 1 - _rapidfuzz_levenshtein.distance(a, b) / max(len(a), len(b))))
+
+    expected = [_reference_ratio(a, b) for a, b in pairs]
+    for name, func in engines:
+        assert [func(a, b) for a, b in pairs] == expected, name
+    for a, b in pairs:
+        for cutoff in (0.5, 0.8, 0.95):
+            reference = _reference_ratio(a, b)
+            assert levenshtein_ratio(a, b, cutoff) == (reference if reference >= cutoff else 0.0)
+
+    baseline = None
+    for name, func in engines:
+        duration = timeit.timeit(lambda: [func(a, b) for a, b in pairs], number=5)
+        baseline = baseline or duration
+        print(f"{name:22s} {duration * 1000 / (5 * len(pairs)):8.4f} ms/comparaison  (x{baseline / duration:.1f})")
+    duration = timeit.timeit(lambda: [levenshtein_ratio(a, b, 0.9) for a, b in pairs], number=5)
+    print(f"{'seuil 0.9':22s} {duration * 1000 / (5 * len(pairs)):8.4f} ms/comparaison  (x{baseline / duration:.1f})")
@@ -0,0 +1,115 @@
+# tag_snapshot.py
+import logging
+import os
+from pathlib import Path
+from typing import Optional
+
+from mutagen.id3 import ID3
+
+from models import TrackMetadata
+
+logger = logging.getLogger(__name__)
+
+# Correspondance champs EasyID3 -> frames ID3 utilisées pour la lecture
+TEXT_FRAMES = {
+    'title': 'TIT2',
+    'artist': 'TPE1',
+    'album': 'TALB',
+    'album_artist': 'TPE2',
+    'label': 'TCOM',
+    'catalog_number': 'TIT1',
+    'artist_sort': 'TSOP',
+    'musicbrainz_artist_id': 'TXXX:MusicBrainz Artist Id',
+}
+
+ID3_HEADER_SIZE = 10
+# Fenêtre de recherche de la synchro MPEG après le tag (padding mal déclaré)
+FRAME_SYNC_WINDOW = 4096
+
+
+def probe_mp3(path: Path) -> bool:
+    """Vérifie rapidement qu'un fichier est un MP3 avec un tag ID3v2 valide.
+
+    Seuls l'en-tête ID3v2 (10 octets), la taille déclarée du tag et la
+    synchronisation de la première trame MPEG sont lus : le contenu du tag
+    (pochettes comprises) n'est jamais parsé.
+    """
+    try:
+        with open(path, 'rb') as f:
+            header = f.read(ID3_HEADER_SIZE)
+            if len(header) < ID3_HEADER_SIZE or header[:3] != b'ID3':
+                return False
+
+            major, revision, flags = header[3], header[4], header[5]
+            size_bytes = header[6:10]
+            # Versions supportées par mutagen, taille encodée en "syncsafe"
+            if major not in (2, 3, 4) or revision == 0xFF or any(b & 0x80 for b in size_bytes):
+                return False
+
+            tag_size = 0
+            for b in size_bytes:
+                tag_size = (tag_size << 7) | b
+            audio_start = ID3_HEADER_SIZE + tag_size
+            if major == 4 and flags & 0x10:  # Pied de tag ID3v2.4
+                audio_start += ID3_HEADER_SIZE
+
+            if audio_start >= os.fstat(f.fileno()).st_size:
+                return False
+
+            f.seek(audio_start)
+            window = f.read(FRAME_SYNC_WINDOW)
+    except OSError:
+        return False
+
+    # Synchro de trame MPEG : 11 bits à 1
+    index = window.find(b'\xff')
+    while index != -1 and index + 1 < len(window):
+        if window[index + 1] & 0xE0 == 0xE0:
+            return True
+        index = window.find(b'\xff', index + 1)
+    return False
+
+
+class TagSnapshot:
+    """Instantané des tags ID3 d'un fichier, lu une seule fois et réutilisé jusqu'à la sauvegarde."""
+
+    def __init__(self, path: Path, tags: Optional[ID3] = None, metadata: Optional[TrackMetadata] = None):
+        self.path = path
+        self._tags = tags
+        self.metadata = metadata if metadata is not None else self._extract_metadata(self.tags)
+
+    @classmethod
+    def load(cls, path: Path) -> 'TagSnapshot':
+        """Parse les tags du fichier (lève une exception si le fichier n'a pas de tag ID3)."""
+        return cls(path, ID3(str(path)))
+
+    @property
+    def tags(self) -> ID3:
+        """Tags ID3 parsés, chargés à la première utilisation si nécessaire."""
+        if self._tags is None:
+            self._tags = ID3(str(self.path))
+        return self._tags
+
+    def save(self) -> None:
+        """Sauvegarde les tags modifiés et rafraîchit les métadonnées de l'instantané."""
+        self.tags.save(str(self.path), v2_version=4)
+        self.metadata = self._extract_metadata(self.tags)
+
+    def release(self) -> None:
+        """Libère les tags parsés (les métadonnées restent disponibles)."""
+        self._tags = None
+
+    @staticmethod
+    def _first_text(tags: ID3, frame_id: str) -> str:
+        frame = tags.get(frame_id)
+        if frame is None or not frame.text:
+            return ''
+        return str(frame.text[0])
+
+    @classmethod
+    def _extract_metadata(cls, tags: ID3) -> TrackMetadata:
+        """Construit les métadonnées de la piste avec la même sémantique qu'EasyID3."""
+        values = {field: cls._first_text(tags, frame_id) for field, frame_id in TEXT_FRAMES.items()}
+        genre_frame = tags.get('TCON')
+        genres = genre_frame.genres if genre_frame is not None else []
+        return TrackMetadata(genre=genres[0] if genres else '', **values)